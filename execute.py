@@ -101,6 +101,32 @@ def load_environment() -> dict[str, str]:
     return env_vars
 
 
+def save_context_file(execution_context, output_dir: str) -> Path:
+    """
+    Write the dry-run context dump for an issue.
+
+    Args:
+        execution_context: Stage 4 output (ExecutionContext)
+        output_dir: Directory for output files
+
+    Returns:
+        Path of the written <ISSUE>_context.md file
+    """
+    issue_key = execution_context.issue_key
+    output_path = Path(output_dir) / issue_key
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    context_file = output_path / f"{issue_key}_context.md"
+    context_file.write_text(
+        f"# Context for {issue_key}\n\n"
+        f"Generated: {execution_context.timestamp_iso}\n\n"
+        f"---\n\n"
+        f"{execution_context.build_prompt_context()}",
+        encoding="utf-8"
+    )
+    return context_file
+
+
 def execute_pipeline(
     task_input: str,
     dry_run: bool = False,
@@ -299,17 +325,7 @@ def execute_pipeline(
             console.print("\n[bold]Stage 5: LLM Execution [SKIPPED - dry-run][/bold]")
 
             # Save context file only
-            output_path = Path(output_dir) / issue_key
-            output_path.mkdir(parents=True, exist_ok=True)
-
-            context_file = output_path / f"{issue_key}_context.md"
-            context_file.write_text(
-                f"# Context for {issue_key}\n\n"
-                f"Generated: {execution_context.timestamp.isoformat()}\n\n"
-                f"---\n\n"
-                f"{execution_context.build_prompt_context()}",
-                encoding="utf-8"
-            )
+            context_file = save_context_file(execution_context, output_dir)
 
             console.print(f"  [green]✓[/green] Context saved: {context_file}")
 
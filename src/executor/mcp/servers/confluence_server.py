@@ -13,108 +13,87 @@ MCP Tools provided:
 - confluence_get_project_passport: Get and parse Project Passport
 """
 
+import asyncio
 import os
-import re
 import sys
 import logging
+import threading
 import time
-from datetime import datetime
-from typing import Any, Sequence
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from functools import cache, lru_cache
+from datetime import UTC, datetime
+from typing import Any
+import ijson
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 
-# Add package root to path for model imports
-# Need 4 levels up: servers -> mcp -> executor -> src
-_package_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-if _package_root not in sys.path:
-    sys.path.insert(0, _package_root)
+# When spawned as a script (by MCPClient), add package root to path for model
+# imports. Need 4 levels up: servers -> mcp -> executor -> src
+if __name__ == "__main__":
+    _package_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    if _package_root not in sys.path:
+        sys.path.insert(0, _package_root)
 
 # Import models from canonical location
 from executor.models import ConfluenceSpace, ConfluencePage
 
-# Import shared rate limiter
+# Import shared rate limiter and HTML cleaner
 from executor.utils.rate_limiter import RateLimiter
+from executor.utils.html_cleaner import clean_confluence_html
 
 # MCP SDK imports
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 from mcp import stdio_server
 
-# HTML processing
-from bs4 import BeautifulSoup
-import html2text
-
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("confluence_mcp_server")
 
+# Expansions requested for full page payloads (body, version, space)
+_PAGE_EXPAND = "body.storage,version,space"
+# Expansions for listings that only show metadata
+_META_EXPAND = "version,space"
 
-def clean_confluence_html(html_content: str) -> str:
-    """
-    Clean Confluence HTML storage format to clean Markdown.
+# Top-level page keys read by _parse_confluence_page; everything else is skipped
+# while streaming the response.
+_PAGE_FIELDS = frozenset(
+    {"id", "title", "status", "body", "space", "version", "history", "ancestors", "metadata", "_links"}
+)
 
-    Confluence uses custom HTML tags and macros. This function:
-    1. Parses HTML with BeautifulSoup
-    2. Removes Confluence-specific macros
-    3. Converts to Markdown using html2text
-    4. Cleans up whitespace and formatting
-    """
-    if not html_content or html_content.strip() == "":
-        return ""
-
-    soup = BeautifulSoup(html_content, "html.parser")
-
-    # Remove Confluence macros
-    for macro in soup.find_all("ac:structured-macro"):
-        macro_name = macro.get("ac:name", "")
-        if macro_name == "code":
-            code_body = macro.find("ac:plain-text-body")
-            if code_body:
-                code_tag = soup.new_tag("pre")
-                code_tag.string = code_body.get_text()
-                macro.replace_with(code_tag)
-        elif macro_name in ["panel", "info", "note", "warning"]:
-            rich_text = macro.find("ac:rich-text-body")
-            if rich_text:
-                blockquote = soup.new_tag("blockquote")
-                blockquote.string = rich_text.get_text()
-                macro.replace_with(blockquote)
-        else:
-            macro.decompose()
+# Response cache: TTLs (seconds) per endpoint kind, and max entries
+_SEARCH_TTL = 10.0
+_PAGE_TTL = 30.0
+_SPACE_TTL = 60.0
+_CACHE_MAXSIZE = 512
 
-    for tag in soup.find_all(["ac:parameter", "ac:link", "ac:image"]):
-        tag.decompose()
+# Ids per get_pages_by_ids() search; Confluence caps the search limit, and
+# caps it lower when the page body is expanded
+_PAGE_BATCH = 25
 
-    # Clean tables
-    for table in soup.find_all("table"):
-        table.attrs = {}
 
-    # Convert Confluence links
-    for link in soup.find_all("ri:page"):
-        title = link.get("ri:content-title", "")
-        if title:
-            a_tag = soup.new_tag("a", href=f"#{title}")
-            a_tag.string = title
-            link.replace_with(a_tag)
+def _read_json(response: requests.Response) -> Any:
+    return orjson.loads(response.content)
 
-    # Convert to Markdown
-    h = html2text.HTML2Text()
-    h.ignore_links = False
-    h.ignore_images = False
-    h.ignore_emphasis = False
-    h.body_width = 0
-    h.unicode_snob = True
-    h.skip_internal_links = True
 
-    markdown = h.handle(str(soup))
+def _read_page_fields(response: requests.Response) -> dict:
+    """Stream a page object, keeping only the top-level keys in _PAGE_FIELDS."""
+    response.raw.decode_content = True
+    return {
+        key: value
+        for key, value in ijson.kvitems(response.raw, "", use_float=True)
+        if key in _PAGE_FIELDS
+    }
 
-    # Cleanup
-    markdown = re.sub(r"\n{3,}", "\n\n", markdown)
-    markdown = "\n".join(line.rstrip() for line in markdown.split("\n"))
-    markdown = re.sub(r"^(\s*)-\s+", r"\1- ", markdown, flags=re.MULTILINE)
-    markdown = markdown.strip()
 
-    return markdown
+def _read_search_results(response: requests.Response) -> list[dict]:
+    """Stream the results array of a search response."""
+    response.raw.decode_content = True
+    return list(ijson.items(response.raw, "results.item", use_float=True))
 
 
 class ConfluenceAPIClient:
@@ -133,48 +112,96 @@ class ConfluenceAPIClient:
         self.auth = HTTPBasicAuth(email, api_token)
         self.session = requests.Session()
         self.session.auth = self.auth
-        self.session.headers.update({"Accept": "application/json"})
+        self.session.headers.update({
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        })
+
+        # Retries (incl. 429 Retry-After) are handled by urllib3 in the adapter
+        retries = Retry(
+            total=3,
+            backoff_factor=1.0,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # Sized pool so back-to-back/concurrent calls reuse TCP+TLS connections
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self._rate_limiter = RateLimiter(requests_per_second=10.0, burst_size=20)
 
+        # (url, params) -> (expires_at, value); see _get()
+        self._cache: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
     def _request(self, method: str, url: str, **kwargs) -> requests.Response:
-        """Make rate-limited request with retry."""
-        max_retries = 3
-        base_delay = 1.0
+        """Make rate-limited request (retries are done by the session adapter)."""
         # Default timeout: 5s connect, 30s read
         kwargs.setdefault("timeout", (5, 30))
 
-        for attempt in range(max_retries + 1):
-            self._rate_limiter.acquire_sync()
-
-            try:
-                response = self.session.request(method, url, **kwargs)
-
-                if response.status_code == 429:
-                    if attempt < max_retries:
-                        retry_after = int(response.headers.get("Retry-After", base_delay * (2 ** attempt)))
-                        logger.warning(f"Rate limited (429), retrying in {retry_after}s")
-                        time.sleep(retry_after)
-                        continue
-                    response.raise_for_status()
-
-                response.raise_for_status()
-                return response
-
-            except requests.exceptions.RequestException as e:
-                if attempt < max_retries and getattr(getattr(e, 'response', None), 'status_code', None) in (429, 503):
-                    delay = base_delay * (2 ** attempt)
-                    logger.warning(f"Request failed, retrying in {delay}s: {e}")
-                    time.sleep(delay)
-                    continue
-                raise
-
-        raise RuntimeError("Max retries exceeded")
+        self._rate_limiter.acquire_sync()
+        response = self.session.request(method, url, **kwargs)
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError:
+            # A streamed error body is never read, so release its connection
+            response.close()
+            raise
+        return response
+
+    def _get(
+        self,
+        url: str,
+        params: dict | None,
+        ttl: float,
+        read: Callable[[requests.Response], Any] = _read_json,
+        stream: bool = False,
+    ) -> Any:
+        """
+        GET through a short-lived in-process cache keyed on (url, params).
 
-    def get_page_by_id(self, page_id: str, expand: str = "body.storage,version,space") -> dict:
-        """Get page by ID."""
+        Only successful responses are cached (errors raise before storing).
+        Expired entries are kept until evicted: if Confluence is unreachable
+        or answers 429/5xx after retries, the last good value is served.
+        Cached values are shared between callers and must not be mutated.
+        """
+        key = (url, tuple(sorted(params.items())) if params else ())
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > now:
+                self._cache.move_to_end(key)
+                return entry[1]
+
+        try:
+            with self._request("GET", url, params=params, stream=stream) as response:
+                value = read(response)
+        except requests.exceptions.RequestException as e:
+            status = e.response.status_code if e.response is not None else None
+            if entry is None or (status is not None and status < 500 and status != 429):
+                raise
+            logger.warning(f"Confluence request failed ({e}), serving stale cached response for {url}")
+            return entry[1]
+
+        self._cache_put(key, now + ttl, value)
+        return value
+
+    def _cache_put(self, key: tuple, expires_at: float, value: Any) -> None:
+        """Store a value in the response cache, evicting the oldest entries."""
+        with self._cache_lock:
+            self._cache[key] = (expires_at, value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > _CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
+
+    def get_page_by_id(self, page_id: str, expand: str = _PAGE_EXPAND) -> dict:
+        """Get page by ID (streamed, keeping only the fields the parser reads)."""
         url = f"{self.base_url}/rest/api/content/{page_id}"
         params = {"expand": expand}
-        return self._request("GET", url, params=params).json()
+        return self._get(url, params, _PAGE_TTL, _read_page_fields, stream=True)
 
     def get_page_by_title(self, space_key: str, title: str) -> dict | None:
         """Get page by title in a space."""
@@ -182,151 +209,253 @@ class ConfluenceAPIClient:
         params = {
             "spaceKey": space_key,
             "title": title,
-            "expand": "body.storage,version,space",
+            "expand": _PAGE_EXPAND,
         }
-        results = self._request("GET", url, params=params).json().get("results", [])
+        results = self._get(url, params, _PAGE_TTL).get("results", [])
         return results[0] if results else None
 
-    def search_pages(self, cql: str, limit: int = 25) -> list[dict]:
+    def search_pages(self, cql: str, limit: int = 25, expand: str = _PAGE_EXPAND) -> list[dict]:
         """Search pages using CQL."""
         url = f"{self.base_url}/rest/api/content/search"
-        params = {"cql": cql, "limit": limit, "expand": "body.storage,version,space"}
-        return self._request("GET", url, params=params).json().get("results", [])
+        params = {"cql": cql, "limit": limit, "expand": expand}
+        return self._get(url, params, _SEARCH_TTL, _read_search_results, stream=True)
+
+    def get_pages_by_ids(self, page_ids: list[str], expand: str = _PAGE_EXPAND) -> list[dict]:
+        """
+        Get several pages with CQL `id in (...)` searches of _PAGE_BATCH ids each.
+
+        Each returned page is also cached as if fetched by get_page_by_id(),
+        so follow-up single-page lookups are served without a round trip.
+
+        Raises:
+            ValueError: If a page ID is not numeric
+        """
+        for page_id in page_ids:
+            # IDs go into the CQL verbatim, so anything but digits is rejected
+            if not (page_id.isascii() and page_id.isdigit()):
+                raise ValueError(f"Invalid Confluence page ID: {page_id!r}")
+
+        url = f"{self.base_url}/rest/api/content/search"
+        pages: list[dict] = []
+        for start in range(0, len(page_ids), _PAGE_BATCH):
+            batch = page_ids[start:start + _PAGE_BATCH]
+            params = {"cql": f"id in ({','.join(batch)})", "limit": len(batch), "expand": expand}
+            pages.extend(self._get(url, params, _SEARCH_TTL, _read_search_results, stream=True))
+
+        expires_at = time.monotonic() + _PAGE_TTL
+        for page in pages:
+            page_url = f"{self.base_url}/rest/api/content/{page['id']}"
+            self._cache_put((page_url, (("expand", expand),)), expires_at, page)
+        return pages
 
     def get_space(self, space_key: str) -> dict:
-        """Get space metadata."""
+        """Get space metadata, with the homepage expanded (body, version, space)."""
         url = f"{self.base_url}/rest/api/space/{space_key}"
-        return self._request("GET", url).json()
+        params = {"expand": "homepage.body.storage,homepage.version,homepage.space"}
+        return self._get(url, params, _SPACE_TTL)
 
     def get_page_ancestors(self, page_id: str) -> list[dict]:
         """Get page ancestors (parent chain)."""
         url = f"{self.base_url}/rest/api/content/{page_id}"
         params = {"expand": "ancestors"}
-        result = self._request("GET", url, params=params).json()
+        result = self._get(url, params, _PAGE_TTL)
         return result.get("ancestors", [])
 
 
 # Initialize MCP Server
 app = Server("confluence-mcp-server")
 
-# Initialize Confluence client using shared Atlassian credentials
+# Confluence settings from shared Atlassian credentials
 # CONFLUENCE_URL should include /wiki suffix for Confluence Cloud
 # Fallback: append /wiki to ATLASSIAN_URL if CONFLUENCE_URL not set
+ATLASSIAN_URL = os.getenv("ATLASSIAN_URL", "")
 CONFLUENCE_URL = os.getenv("CONFLUENCE_URL", "")
-if not CONFLUENCE_URL:
-    ATLASSIAN_URL = os.getenv("ATLASSIAN_URL", "")
+if not CONFLUENCE_URL and ATLASSIAN_URL:
     CONFLUENCE_URL = ATLASSIAN_URL.rstrip("/") + "/wiki"
 
 ATLASSIAN_EMAIL = os.getenv("ATLASSIAN_EMAIL", "")
 ATLASSIAN_API_TOKEN = os.getenv("ATLASSIAN_API_TOKEN", "")
 
-if not all([CONFLUENCE_URL, ATLASSIAN_EMAIL, ATLASSIAN_API_TOKEN]):
-    logger.error("Missing required environment variables for Confluence")
-    logger.error("Set CONFLUENCE_URL (or ATLASSIAN_URL), ATLASSIAN_EMAIL, ATLASSIAN_API_TOKEN")
-    import sys
-    sys.exit(1)
 
-logger.info(f"Confluence client initialized: {CONFLUENCE_URL} with account: {ATLASSIAN_EMAIL}")
-confluence_client = ConfluenceAPIClient(CONFLUENCE_URL, ATLASSIAN_EMAIL, ATLASSIAN_API_TOKEN)
-
-
-def _parse_confluence_page(page_data: dict) -> ConfluencePage:
-    """Parse raw Confluence page data to cleaned ConfluencePage model."""
-    body_html = page_data.get("body", {}).get("storage", {}).get("value", "")
+@cache
+def _client() -> ConfluenceAPIClient:
+    """Create the Confluence client on first use (importing the module has no side effects)."""
+    logger.info(f"Confluence client initialized: {CONFLUENCE_URL} with account: {ATLASSIAN_EMAIL}")
+    return ConfluenceAPIClient(CONFLUENCE_URL, ATLASSIAN_EMAIL, ATLASSIAN_API_TOKEN)
+
+
+# Output templates for call_tool (compiled once, filled via format_map)
+_PAGE_TMPL = (
+    "# {title}\n\n"
+    "**Space:** {space_name} ({space_key})\n"
+    "**Version:** {version}\n"
+    "**URL:** {url}\n"
+    "**Labels:** {labels}\n\n"
+    "## Content (Cleaned Markdown)\n\n"
+    "{body}\n"
+)
+_SEARCH_ITEM_TMPL = (
+    "- [ID:{id}] **{title}** ({space_key}) - [View]({url})\n"
+    "  Version: {version}, Labels: {labels}"
+)
+_SPACE_HOME_TMPL = (
+    "# {title} (Space Homepage)\n\n"
+    "**Space:** {space_name} ({space_key})\n"
+    "**URL:** {url}\n\n"
+    "## Content\n\n"
+    "{body}\n"
+)
+_PASSPORT_TMPL = (
+    "# Project Passport: {project_name}\n\n"
+    "**Page ID:** {id}\n"
+    "**URL:** {url}\n"
+    "**Version:** {version}\n\n"
+    "## Content\n\n"
+    "{body}\n"
+)
+_ANCESTOR_TMPL = "{n}. [ID:{id}] {title}"
+_DIRECT_PARENT_TMPL = "\nDirect parent: [ID:{id}] {title}"
+
+
+# Stand-in for timestamps the payload does not carry (history is not expanded,
+# so createdDate is usually absent); fixed so parsing never reads the clock
+_MISSING_DT = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+@lru_cache(maxsize=1024)
+def _parse_cf_dt(value: str) -> datetime:
+    """Parse a Confluence timestamp (e.g. 2024-01-15T10:30:00.000Z), cached per string."""
+    return datetime.fromisoformat(value)
+
+
+def _dig(data: Any, *keys: str, default: Any = None) -> Any:
+    """Follow nested dict keys, returning default on any missing/None level."""
+    for key in keys:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
+
+def _parse_confluence_page(page_data: dict, with_body: bool = True) -> ConfluencePage:
+    """
+    Parse raw Confluence page data to cleaned ConfluencePage model.
 
-    space_data = page_data.get("space", {})
-    space = ConfluenceSpace(
-        key=space_data.get("key", ""),
-        name=space_data.get("name", ""),
-        id=str(space_data.get("id", "")),
+    Payloads come from the Confluence API, so the model is built with
+    model_construct(): the body is cleaned once here and validation is skipped.
+    With with_body=False the body is left empty and never cleaned.
+    """
+    if with_body:
+        body = clean_confluence_html(_dig(page_data, "body", "storage", "value", default=""))
+    else:
+        body = ""
+
+    space = ConfluenceSpace.model_construct(
+        key=_dig(page_data, "space", "key", default=""),
+        name=_dig(page_data, "space", "name", default=""),
+        id=str(_dig(page_data, "space", "id", default="")),
     )
 
     ancestors = page_data.get("ancestors", [])
     parent_id = ancestors[-1]["id"] if ancestors else None
 
-    labels_data = page_data.get("metadata", {}).get("labels", {}).get("results", [])
+    labels_data = _dig(page_data, "metadata", "labels", "results", default=())
     labels = [label.get("name", "") for label in labels_data]
 
-    page_url = f"{ATLASSIAN_URL}{page_data.get('_links', {}).get('webui', '')}"
+    page_url = f"{ATLASSIAN_URL}{_dig(page_data, '_links', 'webui', default='')}"
+
+    created_raw = _dig(page_data, "history", "createdDate")
+    updated_raw = _dig(page_data, "version", "when")
 
-    return ConfluencePage(
+    return ConfluencePage.model_construct(
         id=page_data["id"],
         title=page_data["title"],
         space=space,
         status=page_data.get("status", "current"),
-        body=body_html,
-        version=page_data.get("version", {}).get("number", 1),
-        created=page_data.get("history", {}).get("createdDate", datetime.now().isoformat()),
-        updated=page_data.get("version", {}).get("when", datetime.now().isoformat()),
+        body=body,
+        version=_dig(page_data, "version", "number", default=1),
+        created_at=_parse_cf_dt(created_raw) if created_raw else _MISSING_DT,
+        updated_at=_parse_cf_dt(updated_raw) if updated_raw else _MISSING_DT,
         url=page_url,
         labels=labels,
         parent_id=parent_id,
     )
 
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available Confluence tools."""
-    return [
-        Tool(
-            name="confluence_get_page",
-            description="Get a Confluence page by ID or title (returns cleaned Markdown)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "page_id": {"type": "string", "description": "Page ID (if known)"},
-                    "space_key": {"type": "string", "description": "Space key (required if using title)"},
-                    "title": {"type": "string", "description": "Page title (if using title instead of ID)"},
-                },
+def _parse_confluence_page_meta(page_data: dict) -> ConfluencePage:
+    """Parse page metadata only (for listings that don't render the body)."""
+    return _parse_confluence_page(page_data, with_body=False)
+
+
+# Tool schemas are static; built once at import and returned on every handshake
+_TOOLS: list[Tool] = [
+    Tool(
+        name="confluence_get_page",
+        description="Get a Confluence page by ID or title (returns cleaned Markdown)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "page_id": {"type": "string", "description": "Page ID (if known)"},
+                "space_key": {"type": "string", "description": "Space key (required if using title)"},
+                "title": {"type": "string", "description": "Page title (if using title instead of ID)"},
             },
-        ),
-        Tool(
-            name="confluence_search_pages",
-            description="Search Confluence pages using CQL",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "cql": {"type": "string", "description": "Confluence Query Language (CQL) query"},
-                    "limit": {"type": "number", "description": "Max results (default 25)", "default": 25},
-                },
-                "required": ["cql"],
+        },
+    ),
+    Tool(
+        name="confluence_search_pages",
+        description="Search Confluence pages using CQL",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "cql": {"type": "string", "description": "Confluence Query Language (CQL) query"},
+                "limit": {"type": "number", "description": "Max results (default 25)", "default": 25},
             },
-        ),
-        Tool(
-            name="confluence_get_space_home",
-            description="Get the homepage of a Confluence space",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "space_key": {"type": "string", "description": "Space key"},
-                },
-                "required": ["space_key"],
+            "required": ["cql"],
+        },
+    ),
+    Tool(
+        name="confluence_get_space_home",
+        description="Get the homepage of a Confluence space",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "space_key": {"type": "string", "description": "Space key"},
             },
-        ),
-        Tool(
-            name="confluence_get_project_passport",
-            description="Get and parse a Project Passport page",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "space_key": {"type": "string", "description": "Space key"},
-                    "project_name": {"type": "string", "description": "Project name (to find the page)"},
-                },
-                "required": ["space_key", "project_name"],
+            "required": ["space_key"],
+        },
+    ),
+    Tool(
+        name="confluence_get_project_passport",
+        description="Get and parse a Project Passport page",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "space_key": {"type": "string", "description": "Space key"},
+                "project_name": {"type": "string", "description": "Project name (to find the page)"},
             },
-        ),
-        Tool(
-            name="confluence_get_page_ancestors",
-            description="Get the ancestor chain (parents) of a Confluence page",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "page_id": {"type": "string", "description": "Page ID"},
-                },
-                "required": ["page_id"],
+            "required": ["space_key", "project_name"],
+        },
+    ),
+    Tool(
+        name="confluence_get_page_ancestors",
+        description="Get the ancestor chain (parents) of a Confluence page",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "page_id": {"type": "string", "description": "Page ID"},
             },
-        ),
-    ]
+            "required": ["page_id"],
+        },
+    ),
+]
+
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available Confluence tools."""
+    return _TOOLS
 
 
 @app.call_tool()
@@ -338,10 +467,11 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             space_key = arguments.get("space_key")
             title = arguments.get("title")
 
+            page_data: dict | None
             if page_id:
-                page_data = confluence_client.get_page_by_id(page_id)
+                page_data = await asyncio.to_thread(_client().get_page_by_id, page_id)
             elif space_key and title:
-                page_data = confluence_client.get_page_by_title(space_key, title)
+                page_data = await asyncio.to_thread(_client().get_page_by_title, space_key, title)
                 if not page_data:
                     return [TextContent(type="text", text=f"Page not found: {title}")]
             else:
@@ -349,57 +479,63 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
 
             page = _parse_confluence_page(page_data)
 
-            result = f"""# {page.title}
-
-**Space:** {page.space.name} ({page.space.key})
-**Version:** {page.version}
-**URL:** {page.url}
-**Labels:** {', '.join(page.labels)}
-
-## Content (Cleaned Markdown)
-
-{page.body}
-"""
+            result = _PAGE_TMPL.format_map({
+                "title": page.title,
+                "space_name": page.space.name,
+                "space_key": page.space.key,
+                "version": page.version,
+                "url": page.url,
+                "labels": ", ".join(page.labels),
+                "body": page.body,
+            })
             return [TextContent(type="text", text=result)]
 
         elif name == "confluence_search_pages":
             cql = arguments["cql"]
             limit = arguments.get("limit", 25)
             logger.info(f"Searching Confluence with CQL: {cql}")
-            results = confluence_client.search_pages(cql, limit=limit)
-            pages = [_parse_confluence_page(d) for d in results]
+            # Listing renders metadata only: don't fetch or clean bodies
+            results = await asyncio.to_thread(_client().search_pages, cql, limit=limit, expand=_META_EXPAND)
+            pages = [_parse_confluence_page_meta(d) for d in results]
             logger.info(f"Found {len(pages)} pages")
 
-            output_lines = [f"Found {len(pages)} pages:\n"]
+            parts = [f"Found {len(pages)} pages:\n"]
             for page in pages:
                 # Include page ID explicitly for reliable parsing
-                output_lines.append(
-                    f"- [ID:{page.id}] **{page.title}** ({page.space.key}) - [View]({page.url})\n"
-                    f"  Version: {page.version}, Labels: {', '.join(page.labels)}"
-                )
+                parts.append(_SEARCH_ITEM_TMPL.format_map({
+                    "id": page.id,
+                    "title": page.title,
+                    "space_key": page.space.key,
+                    "url": page.url,
+                    "version": page.version,
+                    "labels": ", ".join(page.labels),
+                }))
                 logger.debug(f"  Page: id={page.id}, title={page.title}")
-            return [TextContent(type="text", text="\n".join(output_lines))]
+            return [TextContent(type="text", text="\n".join(parts))]
 
         elif name == "confluence_get_space_home":
             space_key = arguments["space_key"]
-            space_data = confluence_client.get_space(space_key)
+            space_data = await asyncio.to_thread(_client().get_space, space_key)
 
-            homepage_id = space_data.get("homepage", {}).get("id")
+            homepage = space_data.get("homepage", {})
+            homepage_id = homepage.get("id")
             if not homepage_id:
                 return [TextContent(type="text", text=f"Space {space_key} has no homepage")]
 
-            page_data = confluence_client.get_page_by_id(homepage_id)
+            # Homepage comes expanded with the space; fetch it only if not
+            if "body" in homepage:
+                page_data = homepage
+            else:
+                page_data = await asyncio.to_thread(_client().get_page_by_id, homepage_id)
             page = _parse_confluence_page(page_data)
 
-            result = f"""# {page.title} (Space Homepage)
-
-**Space:** {page.space.name} ({page.space.key})
-**URL:** {page.url}
-
-## Content
-
-{page.body}
-"""
+            result = _SPACE_HOME_TMPL.format_map({
+                "title": page.title,
+                "space_name": page.space.name,
+                "space_key": page.space.key,
+                "url": page.url,
+                "body": page.body,
+            })
             return [TextContent(type="text", text=result)]
 
         elif name == "confluence_get_project_passport":
@@ -407,7 +543,7 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             project_name = arguments["project_name"]
 
             cql = f'space = {space_key} AND title ~ "Project Passport" AND title ~ "{project_name}"'
-            results = confluence_client.search_pages(cql, limit=1)
+            results = await asyncio.to_thread(_client().search_pages, cql, limit=1)
 
             if not results:
                 return [TextContent(type="text", text=f"Project Passport not found for: {project_name} in {space_key}")]
@@ -415,36 +551,38 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             page_data = results[0]
             page = _parse_confluence_page(page_data)
 
-            result = f"""# Project Passport: {project_name}
-
-**Page ID:** {page.id}
-**URL:** {page.url}
-**Version:** {page.version}
-
-## Content
-
-{page.body}
-"""
+            result = _PASSPORT_TMPL.format_map({
+                "project_name": project_name,
+                "id": page.id,
+                "url": page.url,
+                "version": page.version,
+                "body": page.body,
+            })
             return [TextContent(type="text", text=result)]
 
         elif name == "confluence_get_page_ancestors":
             page_id = arguments["page_id"]
-            ancestors = confluence_client.get_page_ancestors(page_id)
+            ancestors = await asyncio.to_thread(_client().get_page_ancestors, page_id)
 
             if not ancestors:
                 return [TextContent(type="text", text=f"No ancestors found for page {page_id} (may be root page)")]
 
-            output_lines = [f"Ancestors for page {page_id} (from root to parent):\n"]
-            for i, ancestor in enumerate(ancestors):
-                ancestor_id = ancestor.get("id", "")
-                ancestor_title = ancestor.get("title", "Unknown")
-                output_lines.append(f"{i+1}. [ID:{ancestor_id}] {ancestor_title}")
+            parts = [f"Ancestors for page {page_id} (from root to parent):\n"]
+            for i, ancestor in enumerate(ancestors, 1):
+                parts.append(_ANCESTOR_TMPL.format_map({
+                    "n": i,
+                    "id": ancestor.get("id", ""),
+                    "title": ancestor.get("title", "Unknown"),
+                }))
 
             # Last ancestor is the direct parent
             direct_parent = ancestors[-1]
-            output_lines.append(f"\nDirect parent: [ID:{direct_parent.get('id', '')}] {direct_parent.get('title', '')}")
+            parts.append(_DIRECT_PARENT_TMPL.format_map({
+                "id": direct_parent.get("id", ""),
+                "title": direct_parent.get("title", ""),
+            }))
 
-            return [TextContent(type="text", text="\n".join(output_lines))]
+            return [TextContent(type="text", text="\n".join(parts))]
 
         else:
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
@@ -456,10 +594,14 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
 
 async def main():
     """Run the MCP server."""
+    if not all([CONFLUENCE_URL, ATLASSIAN_EMAIL, ATLASSIAN_API_TOKEN]):
+        logger.error("Missing required environment variables for Confluence")
+        logger.error("Set CONFLUENCE_URL (or ATLASSIAN_URL), ATLASSIAN_EMAIL, ATLASSIAN_API_TOKEN")
+        sys.exit(1)
+
     async with stdio_server() as (read_stream, write_stream):
         await app.run(read_stream, write_stream, app.create_initialization_options())
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
@@ -15,24 +15,36 @@ MCP Tools provided:
 - jira_create_issue: Create a new issue
 """
 
+import asyncio
+import base64
+import hashlib
+import io
 import os
 import re
 import sys
 import logging
+import threading
 import time
-from typing import Any, Sequence
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from functools import cache, lru_cache
+from typing import Any, ClassVar
+import ijson
+import orjson
 import requests
-from requests.auth import HTTPBasicAuth
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+from urllib3.util.retry import Retry
 
-# Add package root to path for model imports
-# Need 4 levels up: servers -> mcp -> executor -> src
-_package_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-if _package_root not in sys.path:
-    sys.path.insert(0, _package_root)
+# When spawned as a script (by MCPClient), add package root to path for model
+# imports. Need 4 levels up: servers -> mcp -> executor -> src
+if __name__ == "__main__":
+    _package_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    if _package_root not in sys.path:
+        sys.path.insert(0, _package_root)
 
 # Import models from canonical location
-from executor.models import JiraUser, JiraStatus, JiraIssueType, JiraProject, JiraIssue
+from executor.models import JiraIssue
 
 # Import shared rate limiter
 from executor.utils.rate_limiter import RateLimiter
@@ -46,6 +58,55 @@ from mcp import stdio_server
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("jira_mcp_server")
 
+# orjson decodes straight from the response bytes and is several times faster
+# than stdlib json on large ADF payloads.
+_loads = orjson.loads
+_dumps = orjson.dumps
+
+# Transition IDs rarely change within a project's workflow
+_TRANSITIONS_TTL = 600.0
+
+# Bound for the Markdown->ADF and ADF->text conversion caches
+_CONVERT_CACHE_MAXSIZE = 1024
+
+# Issue/comment GET cache: entries are served without a request for _ISSUE_TTL
+# seconds, then revalidated by ETag; writes through this client invalidate them
+_ISSUE_TTL = 60.0
+_GET_CACHE_MAXSIZE = 256
+
+# Rate limiter burst; the connection pool is sized to match, so a full burst
+# of concurrent calls never waits for (or discards) a pooled connection
+_RATE_BURST = 20
+
+# Max concurrent issue fetches in hydrate_many(); stays within the pool size
+_HYDRATE_CONCURRENCY = 16
+
+# Markdown patterns, compiled once for MarkdownToADF
+_RE_HEADER = re.compile(r"^(#{1,6})\s+(.+)$")
+_RE_BULLET = re.compile(r"^[-*]\s+")
+_RE_NUMBERED = re.compile(r"^\d+\.\s+")
+# Inline tokens as one alternation; alternatives are tried in order at each
+# position, so precedence is link, code, bold, italic, strike, plain text
+_RE_INLINE = re.compile(
+    r"(?P<link>\[(?P<link_text>[^\]]+)\]\((?P<href>[^)]+)\))"
+    r"|(?P<code>`[^`]+`)"
+    r"|(?P<strong>\*\*[^*]+\*\*|__[^_]+__)"
+    r"|(?P<em>\*[^*]+\*|_[^_]+_)"
+    r"|(?P<strike>~~[^~]+~~)"
+    r"|(?P<plain>[^[`*_~]+)"
+)
+# Delimiter width of each marked inline token, keyed by its group (= ADF mark type)
+_INLINE_MARK_WIDTH = {"code": 1, "strong": 2, "em": 1, "strike": 2}
+
+# Constant ADF fragments reused across nodes instead of being rebuilt per
+# call; converted documents are only ever serialized, never mutated
+_EMPTY_TEXT = {"type": "text", "text": ""}
+_EMPTY_DOC = {"type": "doc", "version": 1, "content": []}
+_INLINE_MARKS = {kind: [{"type": kind}] for kind in _INLINE_MARK_WIDTH}
+
+# Runs of 3+ newlines in extracted ADF text
+_RE_BLANKS = re.compile(r"\n{3,}")
+
 
 class MarkdownToADF:
     """Convert Markdown to Atlassian Document Format (ADF)."""
@@ -64,31 +125,34 @@ class MarkdownToADF:
         - Links
         - Blockquotes
         """
-        if not markdown or not markdown.strip():
-            return {"type": "doc", "version": 1, "content": []}
+        # isspace() tests for blank input without copying it like strip() would
+        if not markdown or markdown.isspace():
+            return _EMPTY_DOC
 
         lines = markdown.split("\n")
+        n = len(lines)
         content = []
         i = 0
 
-        while i < len(lines):
+        while i < n:
             line = lines[i]
+            # Every block is recognised by its first character, so each line
+            # is tested against at most one pattern
+            c = line[:1]
 
             # Code block
-            if line.startswith("```"):
-                code_lines = []
+            if c == "`" and line.startswith("```"):
                 language = line[3:].strip() or None
                 i += 1
-                while i < len(lines) and not lines[i].startswith("```"):
-                    code_lines.append(lines[i])
+                start = i
+                while i < n and not lines[i].startswith("```"):
                     i += 1
-                content.append(cls._code_block("\n".join(code_lines), language))
+                content.append(cls._code_block("\n".join(lines[start:i]), language))
                 i += 1
                 continue
 
             # Header
-            header_match = re.match(r"^(#{1,6})\s+(.+)$", line)
-            if header_match:
+            if c == "#" and (header_match := _RE_HEADER.match(line)):
                 level = len(header_match.group(1))
                 text = header_match.group(2)
                 content.append(cls._heading(text, level))
@@ -96,57 +160,65 @@ class MarkdownToADF:
                 continue
 
             # Blockquote
-            if line.startswith(">"):
+            if c == ">":
                 quote_lines = []
-                while i < len(lines) and lines[i].startswith(">"):
+                while i < n and lines[i].startswith(">"):
                     quote_lines.append(lines[i][1:].strip())
                     i += 1
                 content.append(cls._blockquote("\n".join(quote_lines)))
                 continue
 
             # Bullet list
-            if re.match(r"^[-*]\s+", line):
+            if (c == "-" or c == "*") and _RE_BULLET.match(line):
                 items = []
-                while i < len(lines) and re.match(r"^[-*]\s+", lines[i]):
-                    items.append(re.sub(r"^[-*]\s+", "", lines[i]))
+                while i < n and (item_match := _RE_BULLET.match(lines[i])):
+                    items.append(lines[i][item_match.end():])
                     i += 1
                 content.append(cls._bullet_list(items))
                 continue
 
             # Numbered list
-            if re.match(r"^\d+\.\s+", line):
+            if c.isdigit() and _RE_NUMBERED.match(line):
                 items = []
-                while i < len(lines) and re.match(r"^\d+\.\s+", lines[i]):
-                    items.append(re.sub(r"^\d+\.\s+", "", lines[i]))
+                while i < n and (item_match := _RE_NUMBERED.match(lines[i])):
+                    items.append(lines[i][item_match.end():])
                     i += 1
                 content.append(cls._ordered_list(items))
                 continue
 
             # Empty line (skip)
-            if not line.strip():
+            if not line or line.isspace():
                 i += 1
                 continue
 
-            # Regular paragraph
-            para_lines = [line]
+            # Regular paragraph: find where it ends, then join its lines once.
+            # Inline spans may cross line breaks, so they are parsed on the
+            # joined text rather than line by line.
+            start = i
             i += 1
-            while i < len(lines) and lines[i].strip() and not cls._is_special_line(lines[i]):
-                para_lines.append(lines[i])
+            while i < n:
+                next_line = lines[i]
+                if not next_line or next_line.isspace() or cls._is_special_line(next_line):
+                    break
                 i += 1
-            content.append(cls._paragraph(" ".join(para_lines)))
+            content.append(cls._paragraph(" ".join(lines[start:i])))
 
         return {"type": "doc", "version": 1, "content": content}
 
     @classmethod
     def _is_special_line(cls, line: str) -> bool:
         """Check if line starts a special block."""
-        return (
-            line.startswith("```")
-            or line.startswith("#")
-            or line.startswith(">")
-            or re.match(r"^[-*]\s+", line)
-            or re.match(r"^\d+\.\s+", line)
-        )
+        # The first character rules out almost every plain line without a regex
+        c = line[:1]
+        if c == "#" or c == ">":
+            return True
+        if c == "`":
+            return line.startswith("```")
+        if c == "-" or c == "*":
+            return _RE_BULLET.match(line) is not None
+        if c.isdigit():
+            return _RE_NUMBERED.match(line) is not None
+        return False
 
     @classmethod
     def _paragraph(cls, text: str) -> dict:
@@ -184,102 +256,110 @@ class MarkdownToADF:
     @classmethod
     def _bullet_list(cls, items: list[str]) -> dict:
         """Create bullet list node."""
-        return {
-            "type": "bulletList",
-            "content": [
-                {"type": "listItem", "content": [cls._paragraph(item)]}
-                for item in items
-            ],
-        }
+        return {"type": "bulletList", "content": cls._list_items(items)}
 
     @classmethod
     def _ordered_list(cls, items: list[str]) -> dict:
         """Create ordered list node."""
-        return {
-            "type": "orderedList",
-            "content": [
-                {"type": "listItem", "content": [cls._paragraph(item)]}
-                for item in items
-            ],
-        }
+        return {"type": "orderedList", "content": cls._list_items(items)}
+
+    @classmethod
+    def _list_items(cls, items: list[str]) -> list[dict]:
+        """Create one listItem node (holding a single paragraph) per item."""
+        parse_inline = cls._parse_inline
+        return [
+            {"type": "listItem", "content": [{"type": "paragraph", "content": parse_inline(item)}]}
+            for item in items
+        ]
 
     @classmethod
     def _parse_inline(cls, text: str) -> list[dict]:
         """Parse inline formatting (bold, italic, code, links)."""
         if not text:
-            return [{"type": "text", "text": ""}]
+            return [_EMPTY_TEXT]
 
         result = []
-        remaining = text
-
-        while remaining:
-            # Link: [text](url)
-            link_match = re.match(r"\[([^\]]+)\]\(([^)]+)\)", remaining)
-            if link_match:
-                result.append({
-                    "type": "text",
-                    "text": link_match.group(1),
-                    "marks": [{"type": "link", "attrs": {"href": link_match.group(2)}}],
-                })
-                remaining = remaining[link_match.end():]
+        # Scan with a cursor into text rather than re-slicing the remainder
+        pos = 0
+        end = len(text)
+
+        while pos < end:
+            match = _RE_INLINE.match(text, pos)
+            if match is None:
+                # Single special char (no match)
+                result.append({"type": "text", "text": text[pos]})
+                pos += 1
                 continue
 
-            # Inline code: `code`
-            code_match = re.match(r"`([^`]+)`", remaining)
-            if code_match:
+            kind = match.lastgroup
+            if kind == "plain":
+                # Plain text until next special char
+                result.append({"type": "text", "text": match.group()})
+            elif kind == "link":
+                # Link: [text](url)
                 result.append({
                     "type": "text",
-                    "text": code_match.group(1),
-                    "marks": [{"type": "code"}],
+                    "text": match.group("link_text"),
+                    "marks": [{"type": "link", "attrs": {"href": match.group("href")}}],
                 })
-                remaining = remaining[code_match.end():]
-                continue
-
-            # Bold: **text** or __text__
-            bold_match = re.match(r"\*\*([^*]+)\*\*|__([^_]+)__", remaining)
-            if bold_match:
+            else:
+                # `code`, **bold** / __bold__, *italic* / _italic_, ~~strike~~
+                width = _INLINE_MARK_WIDTH[kind]
                 result.append({
                     "type": "text",
-                    "text": bold_match.group(1) or bold_match.group(2),
-                    "marks": [{"type": "strong"}],
+                    "text": match.group()[width:-width],
+                    "marks": _INLINE_MARKS[kind],
                 })
-                remaining = remaining[bold_match.end():]
-                continue
+            pos = match.end()
 
-            # Italic: *text* or _text_
-            italic_match = re.match(r"\*([^*]+)\*|_([^_]+)_", remaining)
-            if italic_match:
-                result.append({
-                    "type": "text",
-                    "text": italic_match.group(1) or italic_match.group(2),
-                    "marks": [{"type": "em"}],
-                })
-                remaining = remaining[italic_match.end():]
-                continue
+        return result if result else [{"type": "text", "text": text}]
 
-            # Strikethrough: ~~text~~
-            strike_match = re.match(r"~~([^~]+)~~", remaining)
-            if strike_match:
-                result.append({
-                    "type": "text",
-                    "text": strike_match.group(1),
-                    "marks": [{"type": "strike"}],
-                })
-                remaining = remaining[strike_match.end():]
-                continue
 
-            # Plain text until next special char
-            plain_match = re.match(r"[^[`*_~]+", remaining)
-            if plain_match:
-                result.append({"type": "text", "text": plain_match.group()})
-                remaining = remaining[plain_match.end():]
-                continue
+# Cached results are shared between calls; callers only serialize them
+_markdown_to_adf = lru_cache(maxsize=_CONVERT_CACHE_MAXSIZE)(MarkdownToADF.convert)
 
-            # Single special char (no match)
-            result.append({"type": "text", "text": remaining[0]})
-            remaining = remaining[1:]
 
-        return result if result else [{"type": "text", "text": text}]
+class _BasicAuthHeader(AuthBase):
+    """HTTP Basic auth with the header encoded once instead of per request."""
+
+    def __init__(self, username: str, password: str):
+        # latin1, as requests' HTTPBasicAuth encodes credentials
+        token = base64.b64encode(f"{username}:{password}".encode("latin1")).decode("ascii")
+        self.header = f"Basic {token}"
+
+    def __call__(self, r: requests.PreparedRequest) -> requests.PreparedRequest:
+        r.headers["Authorization"] = self.header
+        return r
+
+
+def _read_search_page(response: requests.Response) -> tuple[list[dict], str | None]:
+    """
+    Stream the issues and nextPageToken out of a /search/jql response.
+
+    The body is fed chunk by chunk into two ijson coroutines, so the raw
+    page is never held in memory alongside its parsed issues.
+    """
+    issues: list[dict] = ijson.sendable_list()
+    tokens: list[str] = ijson.sendable_list()
+    parsers = (
+        ijson.items_coro(issues, "issues.item", use_float=True),
+        ijson.items_coro(tokens, "nextPageToken"),
+    )
+    with response:
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            for parser in parsers:
+                parser.send(chunk)
+    for parser in parsers:
+        parser.close()
+    return list(issues), (tokens[0] if tokens else None)
+
+
+def _workflow_key(issue_key: str, issue_data: dict) -> tuple[str, str] | None:
+    """Transition cache key: project key plus issue type ID, which selects the workflow."""
+    issue_type_id = ((issue_data.get("fields") or {}).get("issuetype") or {}).get("id")
+    if not issue_type_id:
+        return None
+    return issue_key.split("-", 1)[0], str(issue_type_id)
 
 
 class JiraAPIClient:
@@ -295,72 +375,171 @@ class JiraAPIClient:
             api_token: API token
         """
         self.base_url = base_url.rstrip("/")
-        self.auth = HTTPBasicAuth(email, api_token)
+        self.auth = _BasicAuthHeader(email, api_token)
         self.session = requests.Session()
         self.session.auth = self.auth
         self.session.headers.update({
             "Accept": "application/json",
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
         })
-        self._rate_limiter = RateLimiter(requests_per_second=10.0, burst_size=20)
+
+        # Retries (incl. 429 Retry-After) are handled by urllib3 in the adapter.
+        # Only 429/503 are retried, for every method: Jira rejects those before
+        # doing any work, so a retried POST cannot create duplicates. Read
+        # errors are not retried for the same reason.
+        retries = Retry(
+            total=3,
+            read=0,
+            backoff_factor=1.0,
+            status_forcelist=[429, 503],
+            allowed_methods=None,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # Sized pool so back-to-back/concurrent calls reuse TCP+TLS connections
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_RATE_BURST, max_retries=retries)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._rate_limiter = RateLimiter(requests_per_second=10.0, burst_size=_RATE_BURST)
+        # (project key, issue type ID) -> (expires_at, {target status name lower: transition id}).
+        # Issue types of one project can use different workflows whose
+        # transition IDs overlap, so the issue type is part of the key.
+        self._transitions_cache: dict[tuple[str, str], tuple[float, dict[str, str]]] = {}
+        # (url, params) -> (expires_at, etag, parsed body); see _get_conditional()
+        self._get_cache: OrderedDict[tuple, tuple[float, str | None, Any]] = OrderedDict()
+        self._get_cache_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close pooled connections held by the session."""
+        self.session.close()
 
     def _request(self, method: str, url: str, **kwargs) -> requests.Response:
-        """Make rate-limited request with retry."""
-        max_retries = 3
-        base_delay = 1.0
+        """Make rate-limited request (retries are done by the session adapter)."""
         # Default timeout: 5s connect, 30s read
         kwargs.setdefault("timeout", (5, 30))
+        # Encode JSON bodies with orjson; the session already sends the
+        # application/json Content-Type
+        if "json" in kwargs:
+            kwargs["data"] = _dumps(kwargs.pop("json"))
+
+        # One token per logical request: the adapter's 429/503 retries already
+        # wait out Retry-After/backoff, so they must not queue for tokens again
+        self._rate_limiter.acquire_sync()
+        response = self.session.request(method, url, **kwargs)
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError:
+            # A streamed error body is never read, so release its connection
+            response.close()
+            raise
+        return response
+
+    def _get_conditional(self, url: str, params: dict | None = None) -> Any:
+        """
+        GET through a short-lived cache with If-None-Match revalidation.
 
-        for attempt in range(max_retries + 1):
-            self._rate_limiter.acquire_sync()
-
-            try:
-                response = self.session.request(method, url, **kwargs)
-
-                if response.status_code == 429:
-                    if attempt < max_retries:
-                        retry_after = int(response.headers.get("Retry-After", base_delay * (2 ** attempt)))
-                        logger.warning(f"Rate limited (429), retrying in {retry_after}s")
-                        time.sleep(retry_after)
-                        continue
-                    response.raise_for_status()
-
-                response.raise_for_status()
-                return response
-
-            except requests.exceptions.RequestException as e:
-                if attempt < max_retries and getattr(getattr(e, 'response', None), 'status_code', None) in (429, 503):
-                    delay = base_delay * (2 ** attempt)
-                    logger.warning(f"Request failed, retrying in {delay}s: {e}")
-                    time.sleep(delay)
-                    continue
-                raise
-
-        raise RuntimeError("Max retries exceeded")
+        Within _ISSUE_TTL the cached parsed body is returned without a
+        request. After that the stored ETag is sent, and a 304 Not Modified
+        renews the entry without downloading or parsing the body again.
+        Responses without an ETag are not cached.
+        """
+        key = (url, tuple(sorted(params.items())) if params else ())
+        with self._get_cache_lock:
+            cached = self._get_cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                self._get_cache.move_to_end(key)
+                return cached[2]
+
+        headers = {"If-None-Match": cached[1]} if cached and cached[1] else None
+        response = self._request("GET", url, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            etag, data = cached[1], cached[2]
+        else:
+            etag, data = response.headers.get("ETag"), _loads(response.content)
+
+        with self._get_cache_lock:
+            if not etag:
+                # Not cached: without an ETag the body could never be revalidated
+                self._get_cache.pop(key, None)
+                return data
+            self._get_cache[key] = (time.monotonic() + _ISSUE_TTL, etag, data)
+            self._get_cache.move_to_end(key)
+            if len(self._get_cache) > _GET_CACHE_MAXSIZE:
+                self._get_cache.popitem(last=False)
+        return data
+
+    def _invalidate_issue(self, issue_key: str) -> None:
+        """Drop cached GETs of an issue and its sub-resources after a write."""
+        issue_url = f"{self.base_url}/rest/api/3/issue/{issue_key}"
+        with self._get_cache_lock:
+            stale = [
+                key for key in self._get_cache
+                if key[0] == issue_url or key[0].startswith(issue_url + "/")
+            ]
+            for key in stale:
+                del self._get_cache[key]
+
+    def _cached_workflow_key(self, issue_key: str) -> tuple[str, str] | None:
+        """Transition cache key from a still-fresh get_issue() response, if any."""
+        key = (f"{self.base_url}/rest/api/3/issue/{issue_key}", (("fields", _ISSUE_FIELDS_PARAM),))
+        with self._get_cache_lock:
+            cached = self._get_cache.get(key)
+        if not cached or cached[0] <= time.monotonic():
+            return None
+        return _workflow_key(issue_key, cached[2])
 
     def get_issue(self, issue_key: str) -> dict:
-        """Get issue by key."""
+        """Get issue by key, projected onto the fields _parse_jira_issue reads."""
         url = f"{self.base_url}/rest/api/3/issue/{issue_key}"
-        params = {"expand": "renderedFields", "fields": "*all"}
-        return self._request("GET", url, params=params).json()
+        return self._get_conditional(url, {"fields": _ISSUE_FIELDS_PARAM})
 
     def search_issues(self, jql: str, max_results: int = 50) -> list[dict]:
         """Search issues with JQL."""
-        url = f"{self.base_url}/rest/api/3/search"
-        payload = {"jql": jql, "maxResults": max_results, "fields": "*all"}
-        return self._request("POST", url, json=payload).json().get("issues", [])
+        issues: list[dict] = []
+        if max_results <= 0:
+            return issues
+        for page in self.search_issues_iter(jql, page_size=min(max_results, 100)):
+            issues.extend(page[: max_results - len(issues)])
+            if len(issues) >= max_results:
+                break
+        return issues
+
+    def search_issues_iter(self, jql: str, page_size: int = 100) -> Iterator[list[dict]]:
+        """
+        Yield pages of issues matching JQL.
+
+        Uses the enhanced search endpoint, following nextPageToken until the
+        result set is exhausted. Only the fields in _ISSUE_FIELDS are requested.
+        """
+        url = f"{self.base_url}/rest/api/3/search/jql"
+        payload: dict[str, Any] = {
+            "jql": jql,
+            "maxResults": page_size,
+            "fields": list(_ISSUE_FIELDS),
+        }
+        while True:
+            response = self._request("POST", url, json=payload, stream=True)
+            issues, token = _read_search_page(response)
+            if issues:
+                yield issues
+            if not token or not issues:
+                return
+            payload["nextPageToken"] = token
 
     def get_comments(self, issue_key: str) -> list[dict]:
         """Get comments for an issue."""
         url = f"{self.base_url}/rest/api/3/issue/{issue_key}/comment"
-        return self._request("GET", url).json().get("comments", [])
+        return self._get_conditional(url).get("comments", [])
 
     def add_comment(self, issue_key: str, body: str) -> dict:
         """Add a comment to an issue."""
         url = f"{self.base_url}/rest/api/3/issue/{issue_key}/comment"
-        adf_body = MarkdownToADF.convert(body)
+        adf_body = _markdown_to_adf(body)
         payload = {"body": adf_body}
-        return self._request("POST", url, json=payload).json()
+        result = _loads(self._request("POST", url, json=payload).content)
+        self._invalidate_issue(issue_key)
+        return result
 
     def transition_issue(self, issue_key: str, target_status: str) -> None:
         """
@@ -371,19 +550,47 @@ class JiraAPIClient:
             target_status: Target status NAME (e.g., "Human Plan Review", "Backlog")
                           NOT the transition name - we find the transition that leads to this status
         """
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}/transitions"
-        transitions = self._request("GET", url).json().get("transitions", [])
-
-        transition_id = None
-        matched_transition_name = None
-
+        issue_url = f"{self.base_url}/rest/api/3/issue/{issue_key}"
+        url = f"{issue_url}/transitions"
+        target = target_status.lower()
+
+        # Try a cached transition ID only when the issue type, and so the
+        # workflow, is known from a fresh get_issue() response. A 400/404/409
+        # means the ID is not valid from the issue's current status, so fall
+        # through to a fresh lookup.
+        workflow = self._cached_workflow_key(issue_key)
+        cached = self._transitions_cache.get(workflow) if workflow else None
+        if cached and cached[0] > time.monotonic() and target in cached[1]:
+            payload = {"transition": {"id": cached[1][target]}}
+            try:
+                self._request("POST", url, json=payload)
+                self._invalidate_issue(issue_key)
+                return
+            except requests.exceptions.HTTPError as e:
+                if getattr(e.response, "status_code", None) not in (400, 404, 409):
+                    raise
+                cached[1].pop(target, None)
+
+        # One request for the available transitions and the issue type they belong to
+        issue_data = _loads(self._request(
+            "GET", issue_url, params={"fields": "issuetype", "expand": "transitions"}
+        ).content)
+        transitions = issue_data.get("transitions", [])
+
+        # Target status name -> first transition leading to it
+        status_map: dict[str, str] = {}
         for trans in transitions:
-            # Check if this transition leads to the target status
-            to_status = trans.get("to", {}).get("name", "")
-            if to_status.lower() == target_status.lower():
-                transition_id = trans["id"]
-                matched_transition_name = trans["name"]
-                break
+            status_map.setdefault(trans.get("to", {}).get("name", "").lower(), trans["id"])
+        transition_id = status_map.get(target)
+
+        workflow = _workflow_key(issue_key, issue_data)
+        if workflow:
+            # Merge with still-fresh entries learned from issues of the same
+            # type in other statuses
+            cached = self._transitions_cache.get(workflow)
+            if cached and cached[0] > time.monotonic():
+                status_map = {**cached[1], **status_map}
+            self._transitions_cache[workflow] = (time.monotonic() + _TRANSITIONS_TTL, status_map)
 
         if not transition_id:
             # List available transitions for debugging
@@ -395,6 +602,7 @@ class JiraAPIClient:
 
         payload = {"transition": {"id": transition_id}}
         self._request("POST", url, json=payload)
+        self._invalidate_issue(issue_key)
 
     def create_issue(
         self,
@@ -430,7 +638,7 @@ class JiraAPIClient:
         }
 
         if description:
-            fields["description"] = MarkdownToADF.convert(description)
+            fields["description"] = _markdown_to_adf(description)
 
         # In Classic Jira, parent field only works for Sub-task types
         # For other hierarchies (Feature→Story), use link_issues() after creation
@@ -441,8 +649,10 @@ class JiraAPIClient:
 
         payload = {"fields": fields}
         logger.info(f"Creating {issue_type} in {project_key}: {summary[:50]}...")
-        result = self._request("POST", url, json=payload).json()
+        result = _loads(self._request("POST", url, json=payload).content)
         logger.info(f"Created issue: {result.get('key', 'unknown')}")
+        if parent_key and "parent" in fields:
+            self._invalidate_issue(parent_key)
         return result
 
     def link_issues(
@@ -466,82 +676,111 @@ class JiraAPIClient:
             "outwardIssue": {"key": from_key},
         }
         self._request("POST", url, json=payload)
-
-
-def extract_adf_text(adf: dict) -> str:
-    """Extract plain text from Atlassian Document Format with basic formatting."""
-    result = []
-
-    def traverse(node: dict, list_prefix: str = "") -> str:
-        node_type = node.get("type", "")
-        content = node.get("content", [])
-
+        self._invalidate_issue(from_key)
+        self._invalidate_issue(to_key)
+
+
+def _adf_walk(root: dict) -> str:
+    """
+    Render an ADF tree to text with an explicit stack instead of recursion.
+
+    Stack entries are nodes to render, literal strings to emit (block
+    suffixes and list prefixes), or ``(kind, start, href)`` closers that
+    rewrite everything emitted since ``start`` as a blockquote or a link.
+    """
+    out: list[str] = []
+    emit = out.append
+    stack: list[Any] = [root]
+    push = stack.append
+    while stack:
+        item = stack.pop()
+        cls = item.__class__
+        if cls is str:
+            emit(item)
+            continue
+        if cls is tuple:
+            kind, start, href = item
+            text = "".join(out[start:])
+            del out[start:]
+            if kind == "blockquote":
+                emit("\n".join("> " + line for line in text.strip().split("\n")) + "\n")
+            else:
+                emit(f"[{text}]({href})" if text else href)
+            continue
+
+        node_type = item.get("type", "")
         if node_type == "text":
-            return node.get("text", "")
-
+            emit(item.get("text", ""))
+            continue
         if node_type == "hardBreak":
-            return "\n"
-
-        if node_type == "paragraph":
-            text = "".join(traverse(child) for child in content)
-            return text + "\n"
-
-        if node_type == "heading":
-            level = node.get("attrs", {}).get("level", 1)
-            text = "".join(traverse(child) for child in content)
-            return "#" * level + " " + text + "\n"
-
-        if node_type == "bulletList":
-            items = []
-            for child in content:
-                items.append(traverse(child, "- "))
-            return "".join(items)
-
-        if node_type == "orderedList":
-            items = []
-            for i, child in enumerate(content, 1):
-                items.append(traverse(child, f"{i}. "))
-            return "".join(items)
-
-        if node_type == "listItem":
-            text = "".join(traverse(child) for child in content)
-            return list_prefix + text
-
-        if node_type == "codeBlock":
-            text = "".join(traverse(child) for child in content)
-            return f"```\n{text}```\n"
-
-        if node_type == "blockquote":
-            text = "".join(traverse(child) for child in content)
-            lines = text.strip().split("\n")
-            return "\n".join("> " + line for line in lines) + "\n"
-
-        # Handle inlineCard (smart links) - extract URL
+            emit("\n")
+            continue
         if node_type == "inlineCard":
-            url = node.get("attrs", {}).get("url", "")
-            return url
+            # Smart links - extract URL
+            emit(item.get("attrs", {}).get("url", ""))
+            continue
 
-        # Handle link marks
-        if node_type == "link":
-            url = node.get("attrs", {}).get("href", "")
-            text = "".join(traverse(child) for child in content)
-            return f"[{text}]({url})" if text else url
+        content = item.get("content", [])
+        if node_type == "paragraph":
+            push("\n")
+        elif node_type == "heading":
+            emit("#" * item.get("attrs", {}).get("level", 1) + " ")
+            push("\n")
+        elif node_type == "bulletList" or node_type == "orderedList":
+            # The marker is only rendered for listItem children
+            bullet = node_type == "bulletList"
+            for i in range(len(content), 0, -1):
+                child = content[i - 1]
+                push(child)
+                if child.get("type") == "listItem":
+                    push("- " if bullet else f"{i}. ")
+            continue
+        elif node_type == "codeBlock":
+            emit("```\n")
+            push("```\n")
+        elif node_type == "blockquote":
+            push(("blockquote", len(out), ""))
+        elif node_type == "link":
+            push(("link", len(out), item.get("attrs", {}).get("href", "")))
+        stack.extend(reversed(content))
+    return "".join(out)
+
+
+# ADF digest -> extracted text, so polling the same comments skips the walk
+_adf_text_cache: OrderedDict[bytes, str] = OrderedDict()
+_adf_text_lock = threading.Lock()
 
-        # Default: just traverse children
-        return "".join(traverse(child) for child in content)
 
+def extract_adf_text(adf: dict) -> str:
+    """Extract plain text from Atlassian Document Format with basic formatting."""
     if adf and isinstance(adf, dict):
-        result = traverse(adf)
+        try:
+            key = hashlib.blake2b(_dumps(adf), digest_size=16).digest()
+        except TypeError:
+            # orjson refuses trees nested deeper than 255 levels; render uncached
+            return _RE_BLANKS.sub("\n\n", _adf_walk(adf)).strip()
+        with _adf_text_lock:
+            cached = _adf_text_cache.get(key)
+            if cached is not None:
+                _adf_text_cache.move_to_end(key)
+                return cached
+
+        result = _adf_walk(adf)
         # Clean up multiple blank lines
-        result = re.sub(r"\n{3,}", "\n\n", result)
-        return result.strip()
+        result = _RE_BLANKS.sub("\n\n", result).strip()
+
+        with _adf_text_lock:
+            _adf_text_cache[key] = result
+            if len(_adf_text_cache) > _CONVERT_CACHE_MAXSIZE:
+                _adf_text_cache.popitem(last=False)
+        return result
     return ""
 
 
 # Initialize MCP Server
 app = Server("jira-mcp-server")
 
-# Initialize Jira client using shared Atlassian credentials
+# Jira settings from shared Atlassian credentials
 ATLASSIAN_URL = os.getenv("ATLASSIAN_URL", "")
 ATLASSIAN_EMAIL = os.getenv("ATLASSIAN_EMAIL", "")
 ATLASSIAN_API_TOKEN = os.getenv("ATLASSIAN_API_TOKEN", "")
@@ -552,69 +791,137 @@ JIRA_PROJECT_DROPDOWN_FIELD = os.getenv("JIRA_PROJECT_DROPDOWN_FIELD", "customfi
 JIRA_PROJECT_TEXT_FIELD = os.getenv("JIRA_PROJECT_TEXT_FIELD", "customfield_10073")
 JIRA_PROJECT_LINK_FIELD = os.getenv("JIRA_PROJECT_LINK_FIELD", "customfield_10107")
 
-if not all([ATLASSIAN_URL, ATLASSIAN_EMAIL, ATLASSIAN_API_TOKEN]):
-    logger.error("Missing required environment variables for Jira")
-    logger.error("Set ATLASSIAN_URL, ATLASSIAN_EMAIL, ATLASSIAN_API_TOKEN")
-    import sys
-    sys.exit(1)
-
-logger.info(f"Jira client initialized with account: {ATLASSIAN_EMAIL}")
-jira_client = JiraAPIClient(ATLASSIAN_URL, ATLASSIAN_EMAIL, ATLASSIAN_API_TOKEN)
-
-
-def _parse_jira_user(user_data: dict | None) -> JiraUser | None:
-    """Parse Jira user data."""
+# Fields read by _parse_jira_issue; issue and search requests project onto
+# these instead of *all
+_ISSUE_FIELDS = (
+    "summary", "status", "issuetype", "project", "assignee", "reporter", "labels",
+    "created", "updated", "parent", "subtasks", "description",
+    JIRA_PROJECT_DROPDOWN_FIELD, JIRA_PROJECT_TEXT_FIELD, JIRA_PROJECT_LINK_FIELD,
+)
+_ISSUE_FIELDS_PARAM = ",".join(_ISSUE_FIELDS)
+
+
+
+@cache
+def _client() -> JiraAPIClient:
+    """Create the Jira client on first use (importing the module has no side effects)."""
+    logger.info(f"Jira client initialized with account: {ATLASSIAN_EMAIL}")
+    return JiraAPIClient(ATLASSIAN_URL, ATLASSIAN_EMAIL, ATLASSIAN_API_TOKEN)
+
+
+# Output templates, filled with str.format_map; list items carry their
+# leading separator so results can be written straight into a buffer
+_ISSUE_TMPL = (
+    "# {key}: {summary}\n\n"
+    "**Type:** {type}\n"
+    "**Status:** {status}\n"
+    "**Project:** {project_name} ({project_key})\n"
+    "**Project Folder:** {project_folder}\n"
+    "**Project Link:** {project_link}\n"
+    "**Assignee:** {assignee}\n"
+    "**Labels:** {labels}\n\n"
+    "## Description\n\n"
+    "{description}\n\n"
+    "## Metadata\n\n"
+    "- Created: {created}\n"
+    "- Updated: {updated}\n"
+    "- Parent: {parent}\n"
+    "- Subtasks: {subtasks}\n"
+)
+_SEARCH_ITEM_TMPL = "\n- **{key}**: {summary}\n  Status: {status}, Type: {type}"
+
+
+class _IssueView:
+    """Mapping over a JiraIssue for _ISSUE_TMPL; each placeholder is computed on lookup."""
+
+    __slots__ = ("issue",)
+
+    _FIELDS: ClassVar[dict[str, Callable[[JiraIssue], Any]]] = {
+        "key": lambda i: i.key,
+        "summary": lambda i: i.summary,
+        "type": lambda i: i.issue_type.name,
+        "status": lambda i: i.status.name,
+        "project_name": lambda i: i.project.name,
+        "project_key": lambda i: i.project.key,
+        "project_folder": lambda i: i.project_folder or "None",
+        "project_link": lambda i: i.project_link or "None",
+        "assignee": lambda i: i.assignee.display_name if i.assignee else "Unassigned",
+        "labels": lambda i: ", ".join(i.labels) if i.labels else "None",
+        "description": lambda i: i.description or "[No description]",
+        "created": lambda i: i.created,
+        "updated": lambda i: i.updated,
+        "parent": lambda i: i.parent_key or "None",
+        "subtasks": lambda i: ", ".join(i.subtasks) if i.subtasks else "None",
+    }
+
+    def __init__(self, issue: JiraIssue):
+        self.issue = issue
+
+    def __getitem__(self, key: str) -> Any:
+        return self._FIELDS[key](self.issue)
+
+
+def _parse_jira_user(user_data: dict | None) -> dict | None:
+    """Map Jira user data onto JiraUser fields."""
     if not user_data:
         return None
-    return JiraUser(
-        account_id=user_data.get("accountId", ""),
-        email=user_data.get("emailAddress"),
-        display_name=user_data.get("displayName", "Unknown"),
-    )
+    return {
+        "account_id": user_data.get("accountId", ""),
+        "email": user_data.get("emailAddress"),
+        "display_name": user_data.get("displayName", "Unknown"),
+    }
 
 
 def _parse_jira_issue(issue_data: dict) -> JiraIssue:
-    """Parse raw Jira issue data to cleaned JiraIssue model."""
-    fields = issue_data.get("fields", {})
-
-    project_data = fields.get("project", {})
-    project = JiraProject(
-        key=project_data.get("key", ""),
-        name=project_data.get("name", ""),
-        id=project_data.get("id", ""),
-    )
-
-    issuetype_data = fields.get("issuetype", {})
-    issue_type = JiraIssueType(
-        id=issuetype_data.get("id", ""),
-        name=issuetype_data.get("name", ""),
-        hierarchical_level=issuetype_data.get("hierarchyLevel", 0),
-    )
-
-    status_data = fields.get("status", {})
-    status = JiraStatus(
-        id=status_data.get("id", ""),
-        name=status_data.get("name", ""),
-        statusCategory=status_data.get("statusCategory", {}).get("name", ""),
-    )
-
-    assignee = _parse_jira_user(fields.get("assignee"))
-    reporter = _parse_jira_user(fields.get("reporter"))
+    """
+    Parse raw Jira issue data to cleaned JiraIssue model.
 
-    parent_data = fields.get("parent")
+    Nested project/type/status/user data is passed as plain dicts, so the
+    whole issue is validated in one model_validate() call instead of
+    building each sub-model separately.
+    """
+    fields = issue_data.get("fields", {})
+    # Bound once: the lookups below all hit the same fields dict
+    get = fields.get
+
+    project_data = get("project", {})
+    project = {
+        "key": project_data.get("key", ""),
+        "name": project_data.get("name", ""),
+        "id": project_data.get("id", ""),
+    }
+
+    issuetype_data = get("issuetype", {})
+    issue_type = {
+        "id": issuetype_data.get("id", ""),
+        "name": issuetype_data.get("name", ""),
+        "hierarchical_level": issuetype_data.get("hierarchyLevel", 0),
+    }
+
+    status_data = get("status", {})
+    status = {
+        "id": status_data.get("id", ""),
+        "name": status_data.get("name", ""),
+        "statusCategory": status_data.get("statusCategory", {}).get("name", ""),
+    }
+
+    assignee = _parse_jira_user(get("assignee"))
+    reporter = _parse_jira_user(get("reporter"))
+
+    parent_data = get("parent")
     parent_key = parent_data.get("key") if parent_data else None
 
-    subtasks = [subtask.get("key", "") for subtask in fields.get("subtasks", [])]
+    subtasks = [subtask.get("key", "") for subtask in get("subtasks", [])]
 
-    created = fields.get("created")
-    updated = fields.get("updated")
+    created = get("created")
+    updated = get("updated")
     if not created or not updated:
         issue_key = issue_data.get("key", "unknown")
         logger.warning(f"Issue {issue_key} missing timestamps: created={created}, updated={updated}")
         raise ValueError(f"Issue {issue_key} missing required timestamp fields")
 
     # Convert ADF description to plain text
-    description_adf = fields.get("description")
+    description_adf = get("description")
     description_text = ""
     if description_adf and isinstance(description_adf, dict):
         description_text = extract_adf_text(description_adf)
@@ -624,224 +931,293 @@ def _parse_jira_issue(issue_data: dict) -> JiraIssue:
     # Extract custom "Project" field (Confluence folder name)
     # Field IDs are configurable via env vars (see .env.example)
     project_folder = ""
-    cf_project_dropdown = fields.get(JIRA_PROJECT_DROPDOWN_FIELD)
+    cf_project_dropdown = get(JIRA_PROJECT_DROPDOWN_FIELD)
     if cf_project_dropdown and isinstance(cf_project_dropdown, dict):
         project_folder = cf_project_dropdown.get("value", "")
     if not project_folder:
         # Fallback to text field
-        project_folder = fields.get(JIRA_PROJECT_TEXT_FIELD, "") or ""
+        project_folder = get(JIRA_PROJECT_TEXT_FIELD, "") or ""
 
     # Extract custom "Project Link" field (direct Confluence URL)
-    project_link = fields.get(JIRA_PROJECT_LINK_FIELD, "") or ""
-
-    return JiraIssue(
-        key=issue_data["key"],
-        id=issue_data["id"],
-        self=issue_data.get("self", ""),
-        project=project,
-        issuetype=issue_type,
-        summary=fields.get("summary", ""),
-        description=description_text,
-        status=status,
-        assignee=assignee,
-        reporter=reporter or JiraUser(account_id="unknown", display_name="Unknown"),
-        labels=fields.get("labels", []),
-        created=created,
-        updated=updated,
-        parent_key=parent_key,
-        subtasks=subtasks,
-        project_folder=project_folder,
-        project_link=project_link,
-    )
-
-
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available Jira tools."""
-    return [
-        Tool(
-            name="jira_get_issue",
-            description="Get a Jira issue by key (returns cleaned data)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "issue_key": {"type": "string", "description": "Issue key (e.g., AI-123)"},
-                },
-                "required": ["issue_key"],
+    project_link = get(JIRA_PROJECT_LINK_FIELD, "") or ""
+
+    return JiraIssue.model_validate({
+        "key": issue_data["key"],
+        "id": issue_data["id"],
+        "self": issue_data.get("self", ""),
+        "project": project,
+        "issuetype": issue_type,
+        "summary": get("summary", ""),
+        "description": description_text,
+        "status": status,
+        "assignee": assignee,
+        "reporter": reporter or {"account_id": "unknown", "display_name": "Unknown"},
+        "labels": get("labels", []),
+        "created": created,
+        "updated": updated,
+        "parent_key": parent_key,
+        "subtasks": subtasks,
+        "project_folder": project_folder,
+        "project_link": project_link,
+    })
+
+
+# Tool schemas are static; built once at import and returned on every handshake
+_TOOLS: list[Tool] = [
+    Tool(
+        name="jira_get_issue",
+        description="Get a Jira issue by key (returns cleaned data)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {"type": "string", "description": "Issue key (e.g., AI-123)"},
             },
-        ),
-        Tool(
-            name="jira_search_issues",
-            description="Search Jira issues using JQL",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "jql": {"type": "string", "description": "JQL query"},
-                    "max_results": {"type": "number", "description": "Max results (default 50)", "default": 50},
-                },
-                "required": ["jql"],
+            "required": ["issue_key"],
+        },
+    ),
+    Tool(
+        name="jira_search_issues",
+        description="Search Jira issues using JQL",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jql": {"type": "string", "description": "JQL query"},
+                "max_results": {"type": "number", "description": "Max results (default 50)", "default": 50},
             },
-        ),
-        Tool(
-            name="jira_get_comments",
-            description="Get comments for a Jira issue (cleaned)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "issue_key": {"type": "string", "description": "Issue key"},
-                },
-                "required": ["issue_key"],
+            "required": ["jql"],
+        },
+    ),
+    Tool(
+        name="jira_get_comments",
+        description="Get comments for a Jira issue (cleaned)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {"type": "string", "description": "Issue key"},
             },
-        ),
-        Tool(
-            name="jira_add_comment",
-            description="Add a comment to a Jira issue",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "issue_key": {"type": "string", "description": "Issue key"},
-                    "body": {"type": "string", "description": "Comment body (Markdown)"},
-                },
-                "required": ["issue_key", "body"],
+            "required": ["issue_key"],
+        },
+    ),
+    Tool(
+        name="jira_add_comment",
+        description="Add a comment to a Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {"type": "string", "description": "Issue key"},
+                "body": {"type": "string", "description": "Comment body (Markdown)"},
             },
-        ),
-        Tool(
-            name="jira_transition_issue",
-            description="Change issue status/transition",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "issue_key": {"type": "string", "description": "Issue key"},
-                    "transition_name": {"type": "string", "description": "Transition name"},
-                },
-                "required": ["issue_key", "transition_name"],
+            "required": ["issue_key", "body"],
+        },
+    ),
+    Tool(
+        name="jira_transition_issue",
+        description="Change issue status/transition",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {"type": "string", "description": "Issue key"},
+                "transition_name": {"type": "string", "description": "Transition name"},
             },
-        ),
-        Tool(
-            name="jira_create_issue",
-            description="Create a new Jira issue",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_key": {"type": "string", "description": "Project key"},
-                    "issue_type": {"type": "string", "description": "Issue type (Feature, Story, Task)"},
-                    "summary": {"type": "string", "description": "Issue summary/title"},
-                    "description": {"type": "string", "description": "Issue description (Markdown)"},
-                    "parent_key": {"type": "string", "description": "Parent issue key (for Stories)"},
-                },
-                "required": ["project_key", "issue_type", "summary"],
+            "required": ["issue_key", "transition_name"],
+        },
+    ),
+    Tool(
+        name="jira_create_issue",
+        description="Create a new Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_key": {"type": "string", "description": "Project key"},
+                "issue_type": {"type": "string", "description": "Issue type (Feature, Story, Task)"},
+                "summary": {"type": "string", "description": "Issue summary/title"},
+                "description": {"type": "string", "description": "Issue description (Markdown)"},
+                "parent_key": {"type": "string", "description": "Parent issue key (for Stories)"},
             },
-        ),
-        Tool(
-            name="jira_link_issues",
-            description="Link two Jira issues (e.g., Blocks, relates to)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "from_key": {"type": "string", "description": "Issue creating the link"},
-                    "to_key": {"type": "string", "description": "Issue being linked to"},
-                    "link_type": {"type": "string", "description": "Link type (Blocks, relates to)", "default": "Blocks"},
-                },
-                "required": ["from_key", "to_key"],
+            "required": ["project_key", "issue_type", "summary"],
+        },
+    ),
+    Tool(
+        name="jira_link_issues",
+        description="Link two Jira issues (e.g., Blocks, relates to)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "from_key": {"type": "string", "description": "Issue creating the link"},
+                "to_key": {"type": "string", "description": "Issue being linked to"},
+                "link_type": {"type": "string", "description": "Link type (Blocks, relates to)", "default": "Blocks"},
             },
-        ),
-    ]
+            "required": ["from_key", "to_key"],
+        },
+    ),
+]
 
 
-@app.call_tool()
-async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
-    """Handle tool calls."""
-    try:
-        if name == "jira_get_issue":
-            issue_key = arguments["issue_key"]
-            issue_data = jira_client.get_issue(issue_key)
-            issue = _parse_jira_issue(issue_data)
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available Jira tools."""
+    return _TOOLS
+
+
+async def hydrate_many(
+    issue_keys: Sequence[str],
+    include_comments: bool = False,
+) -> list[tuple[dict, list[dict] | None] | BaseException]:
+    """
+    Fetch several issues (and optionally their comments) concurrently.
+
+    Requests run in worker threads, at most _HYDRATE_CONCURRENCY at a time.
+    Results are in key order; a failed key yields its exception instead of
+    cancelling the rest of the batch.
+    """
+    semaphore = asyncio.Semaphore(_HYDRATE_CONCURRENCY)
+
+    async def fetch(call: Callable[[str], Any], key: str) -> Any:
+        async with semaphore:
+            return await asyncio.to_thread(call, key)
+
+    async def hydrate(key: str) -> tuple[dict, list[dict] | None]:
+        if not include_comments:
+            return await fetch(_client().get_issue, key), None
+        issue_data, comments = await asyncio.gather(
+            fetch(_client().get_issue, key), fetch(_client().get_comments, key)
+        )
+        return issue_data, comments
 
-            result = f"""# {issue.key}: {issue.summary}
+    return await asyncio.gather(*(hydrate(key) for key in issue_keys), return_exceptions=True)
 
-**Type:** {issue.issue_type.name}
-**Status:** {issue.status.name}
-**Project:** {issue.project.name} ({issue.project.key})
-**Project Folder:** {issue.project_folder or 'None'}
-**Project Link:** {issue.project_link or 'None'}
-**Assignee:** {issue.assignee.display_name if issue.assignee else 'Unassigned'}
-**Labels:** {', '.join(issue.labels) if issue.labels else 'None'}
 
-## Description
+async def _handle_get_issue(arguments: Any) -> list[TextContent]:
+    """Get an issue by key as a Markdown summary."""
+    issue_key = arguments["issue_key"]
+    issue_data = await asyncio.to_thread(_client().get_issue, issue_key)
+    issue = _parse_jira_issue(issue_data)
 
-{issue.description or '[No description]'}
+    result = _ISSUE_TMPL.format_map(_IssueView(issue))
+    return [TextContent(type="text", text=result)]
 
-## Metadata
 
-- Created: {issue.created}
-- Updated: {issue.updated}
-- Parent: {issue.parent_key or 'None'}
-- Subtasks: {', '.join(issue.subtasks) if issue.subtasks else 'None'}
-"""
-            return [TextContent(type="text", text=result)]
-
-        elif name == "jira_search_issues":
-            jql = arguments["jql"]
-            max_results = arguments.get("max_results", 50)
-            issues_data = jira_client.search_issues(jql, max_results=max_results)
-            issues = [_parse_jira_issue(d) for d in issues_data]
-
-            output_lines = [f"Found {len(issues)} issues:\n"]
-            for issue in issues:
-                output_lines.append(
-                    f"- **{issue.key}**: {issue.summary}\n"
-                    f"  Status: {issue.status.name}, Type: {issue.issue_type.name}"
-                )
-            return [TextContent(type="text", text="\n".join(output_lines))]
-
-        elif name == "jira_get_comments":
-            issue_key = arguments["issue_key"]
-            comments_data = jira_client.get_comments(issue_key)
-
-            output_lines = [f"Comments for {issue_key}:\n"]
-            for comment_data in comments_data:
-                author = comment_data.get("author", {}).get("displayName", "Unknown")
-                created = comment_data.get("created", "")
-                body = comment_data.get("body", {})
-                body_text = extract_adf_text(body) if isinstance(body, dict) else str(body)
-                output_lines.append(f"\n### {author} - {created}\n\n{body_text}\n")
-
-            return [TextContent(type="text", text="\n".join(output_lines))]
-
-        elif name == "jira_add_comment":
-            issue_key = arguments["issue_key"]
-            body = arguments["body"]
-            jira_client.add_comment(issue_key, body)
-            return [TextContent(type="text", text=f"Comment added to {issue_key}")]
-
-        elif name == "jira_transition_issue":
-            issue_key = arguments["issue_key"]
-            transition_name = arguments["transition_name"]
-            jira_client.transition_issue(issue_key, transition_name)
-            return [TextContent(type="text", text=f"Issue {issue_key} transitioned to {transition_name}")]
-
-        elif name == "jira_create_issue":
-            project_key = arguments["project_key"]
-            issue_type = arguments["issue_type"]
-            summary = arguments["summary"]
-            description = arguments.get("description", "")
-            parent_key = arguments.get("parent_key")
-
-            result = jira_client.create_issue(project_key, issue_type, summary, description, parent_key)
-            new_key = result.get("key", "")
-            return [TextContent(type="text", text=f"Created issue: {new_key}")]
-
-        elif name == "jira_link_issues":
-            from_key = arguments["from_key"]
-            to_key = arguments["to_key"]
-            link_type = arguments.get("link_type", "Blocks")
-
-            jira_client.link_issues(from_key, to_key, link_type)
-            return [TextContent(type="text", text=f"Linked {from_key} -> {to_key} ({link_type})")]
+def _format_search_page(page: list[dict]) -> str:
+    """Parse one page of search results and render its list items."""
+    return "".join([
+        _SEARCH_ITEM_TMPL.format_map({
+            "key": issue.key,
+            "summary": issue.summary,
+            "status": issue.status.name,
+            "type": issue.issue_type.name,
+        })
+        for issue in map(_parse_jira_issue, page)
+    ])
+
+
+async def _handle_search_issues(arguments: Any) -> list[TextContent]:
+    """Search issues with JQL."""
+    jql = arguments["jql"]
+    max_results = int(arguments.get("max_results", 50))
+
+    # Pages are fetched and parsed in worker threads, so the event loop stays
+    # free; the next page is requested while the current one is parsed, and
+    # fetching stops at max_results
+    parts: list[str] = []
+    count = 0
+    if max_results > 0:
+        pages = _client().search_issues_iter(jql, page_size=min(max_results, 100))
+        page = await asyncio.to_thread(next, pages, None)
+        while page is not None:
+            page = page[: max_results - count]
+            count += len(page)
+            next_page = None
+            if count < max_results:
+                next_page = asyncio.create_task(asyncio.to_thread(next, pages, None))
+            try:
+                parts.append(await asyncio.to_thread(_format_search_page, page))
+                page = await next_page if next_page else None
+            finally:
+                # Formatting failed (or we were cancelled): don't leave the
+                # prefetch behind with an unretrieved result
+                if next_page and not next_page.done():
+                    next_page.cancel()
+    # One join sizes the result exactly once, however many pages were read
+    return [TextContent(type="text", text="".join([f"Found {count} issues:\n", *parts]))]
+
+
+async def _handle_get_comments(arguments: Any) -> list[TextContent]:
+    """Get an issue's comments as Markdown."""
+    issue_key = arguments["issue_key"]
+    comments_data = await asyncio.to_thread(_client().get_comments, issue_key)
+
+    buf = io.StringIO()
+    buf.write(f"Comments for {issue_key}:\n")
+    for comment_data in comments_data:
+        author = comment_data.get("author", {}).get("displayName", "Unknown")
+        created = comment_data.get("created", "")
+        body = comment_data.get("body", {})
+        body_text = extract_adf_text(body) if isinstance(body, dict) else str(body)
+        buf.write(f"\n\n### {author} - {created}\n\n{body_text}\n")
+
+    return [TextContent(type="text", text=buf.getvalue())]
+
+
+async def _handle_add_comment(arguments: Any) -> list[TextContent]:
+    """Add a Markdown comment to an issue."""
+    issue_key = arguments["issue_key"]
+    body = arguments["body"]
+    await asyncio.to_thread(_client().add_comment, issue_key, body)
+    return [TextContent(type="text", text=f"Comment added to {issue_key}")]
+
+
+async def _handle_transition_issue(arguments: Any) -> list[TextContent]:
+    """Move an issue to the named status."""
+    issue_key = arguments["issue_key"]
+    transition_name = arguments["transition_name"]
+    await asyncio.to_thread(_client().transition_issue, issue_key, transition_name)
+    return [TextContent(type="text", text=f"Issue {issue_key} transitioned to {transition_name}")]
+
+
+async def _handle_create_issue(arguments: Any) -> list[TextContent]:
+    """Create a new issue."""
+    project_key = arguments["project_key"]
+    issue_type = arguments["issue_type"]
+    summary = arguments["summary"]
+    description = arguments.get("description", "")
+    parent_key = arguments.get("parent_key")
+
+    result = await asyncio.to_thread(
+        _client().create_issue, project_key, issue_type, summary, description, parent_key
+    )
+    new_key = result.get("key", "")
+    return [TextContent(type="text", text=f"Created issue: {new_key}")]
 
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
+async def _handle_link_issues(arguments: Any) -> list[TextContent]:
+    """Link two issues."""
+    from_key = arguments["from_key"]
+    to_key = arguments["to_key"]
+    link_type = arguments.get("link_type", "Blocks")
+
+    await asyncio.to_thread(_client().link_issues, from_key, to_key, link_type)
+    return [TextContent(type="text", text=f"Linked {from_key} -> {to_key} ({link_type})")]
+
+
+_HANDLERS: dict[str, Callable[[Any], Awaitable[list[TextContent]]]] = {
+    "jira_get_issue": _handle_get_issue,
+    "jira_search_issues": _handle_search_issues,
+    "jira_get_comments": _handle_get_comments,
+    "jira_add_comment": _handle_add_comment,
+    "jira_transition_issue": _handle_transition_issue,
+    "jira_create_issue": _handle_create_issue,
+    "jira_link_issues": _handle_link_issues,
+}
+
+
+@app.call_tool()
+async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
+    """Handle tool calls."""
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    try:
+        return await handler(arguments)
     except Exception as e:
         logger.error(f"Error in tool {name}: {e}", exc_info=True)
         return [TextContent(type="text", text=f"Error: {str(e)}")]
@@ -849,10 +1225,19 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
 
 async def main():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    if not all([ATLASSIAN_URL, ATLASSIAN_EMAIL, ATLASSIAN_API_TOKEN]):
+        logger.error("Missing required environment variables for Jira")
+        logger.error("Set ATLASSIAN_URL, ATLASSIAN_EMAIL, ATLASSIAN_API_TOKEN")
+        sys.exit(1)
+
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+    finally:
+        # Only close a client that was actually created by a tool call
+        if _client.cache_info().currsize:
+            _client().close()
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
@@ -17,6 +17,7 @@ from .confluence_models import (
 from .workflow_state import WorkflowStatus, ExecutorContext
 from .execution_context import (
     JiraContext,
+    ContextComment,
     ConfluenceContext,
     ExecutionContext as PipelineContext,
     # Two-Stage Retrieval models
@@ -54,6 +55,7 @@ __all__ = [
     "ExecutorContext",
     # Pipeline context models (Stage 2-4)
     "JiraContext",
+    "ContextComment",
     "ConfluenceContext",
     "PipelineContext",
     # Two-Stage Retrieval models
@@ -2,7 +2,9 @@
 
 from datetime import datetime
 from typing import Optional, Any
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from ..utils.html_cleaner import clean_confluence_html
 
 
 class ConfluenceSpace(BaseModel):
@@ -12,6 +14,8 @@ class ConfluenceSpace(BaseModel):
     name: str
     id: str
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ConfluencePage(BaseModel):
     """
@@ -42,9 +46,7 @@ class ConfluencePage(BaseModel):
     # Parent page (for hierarchy)
     parent_id: Optional[str] = None
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     @field_validator("body", mode="before")
     @classmethod
@@ -61,9 +63,6 @@ class ConfluencePage(BaseModel):
         else:
             html_content = str(v)
 
-        # Clean HTML (will be implemented in utility)
-        from ..utils.html_cleaner import clean_confluence_html
-
         return clean_confluence_html(html_content)
 
 
@@ -104,13 +103,19 @@ class ProjectPassport(BaseModel):
     # Raw markdown (for reference)
     raw_content: str = Field(..., description="Full cleaned Markdown content")
 
+    model_config = ConfigDict(frozen=True)
+
     @field_validator("project_key", mode="before")
     @classmethod
     def validate_project_key(cls, v: Any) -> str:
         """Validate project key format."""
         if not v:
             return "[DATA MISSING]"
-        return str(v).upper()
+        key = v if type(v) is str else str(v)
+        # Keys usually arrive upper-case already; skip the copy upper() makes
+        if key.isascii() and key.isupper():
+            return key
+        return key.upper()
 
 
 class LogicalArchitecture(BaseModel):
@@ -149,6 +154,8 @@ class LogicalArchitecture(BaseModel):
     # Raw markdown (for reference)
     raw_content: str = Field(..., description="Full cleaned Markdown content")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class SDLCRules(BaseModel):
     """
@@ -171,3 +178,5 @@ class SDLCRules(BaseModel):
     workflow_protocol: str
     error_handling: str
     quality_gates: str
+
+    model_config = ConfigDict(frozen=True)
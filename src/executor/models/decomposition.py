@@ -12,7 +12,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class DecomposedStory:
     """
     A story extracted from LLM work plan.
@@ -28,7 +28,7 @@ class DecomposedStory:
     order: int = 0      # Sequence in work plan
 
 
-@dataclass
+@dataclass(slots=True)
 class ClarificationQuestion:
     """
     A question requiring human input.
@@ -40,7 +40,7 @@ class ClarificationQuestion:
     related_story: Optional[str] = None  # Story title if tied to specific story
 
 
-@dataclass
+@dataclass(slots=True)
 class DecompositionResult:
     """
     Result of parsing LLM response into decomposition artifacts.
@@ -81,7 +81,5 @@ class DecompositionResult:
         """Group stories by layer for display."""
         by_layer: dict[str, list[DecomposedStory]] = {}
         for story in self.stories:
-            if story.layer not in by_layer:
-                by_layer[story.layer] = []
-            by_layer[story.layer].append(story)
+            by_layer.setdefault(story.layer, []).append(story)
         return by_layer
@@ -9,11 +9,15 @@ Stage 4: Data Aggregation → ExecutionContext
 Stage 5: LLM Execution → uses ExecutionContext.prompt_context
 """
 
+import io
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Union, TYPE_CHECKING
 from enum import Enum
 
+from .json_output import JsonBytesMixin
+
 if TYPE_CHECKING:
     from .github_models import GitHubContext
 
@@ -31,6 +35,38 @@ class ContextLocationError(Exception):
     pass
 
 
+# Static prompt blocks for build_prompt_context, keyed by project status.
+# Like the rest of the prompt, each line starts with its "\n" separator.
+_BRAND_NEW_BANNER = (
+    "\n### BRAND NEW PROJECT\n"
+    "\n**IMPORTANT:** This is a greenfield project with no existing Confluence documentation.\n"
+    "\nYour work plan MUST include steps to create:"
+    "\n1. **Project Passport** page with sections:"
+    "\n   - Identity & Ownership"
+    "\n   - Technology Stack"
+    "\n   - Repositories"
+    "\n   - Environments"
+    "\n2. **Logical Architecture** page with sections:"
+    "\n   - Component Diagram"
+    "\n   - Data Flow"
+    "\n   - Contracts & Interfaces"
+    "\n   - Constraints\n"
+    "\nUse `[DOCS]` layer for documentation creation steps.\n"
+)
+_STATUS_BANNERS: dict[ProjectStatus, str] = {
+    ProjectStatus.BRAND_NEW: _BRAND_NEW_BANNER,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class ContextComment:
+    """A Jira comment as parsed for the prompt context."""
+
+    author: str = "Unknown"
+    created: str = ""
+    body: str = ""
+
+
 @dataclass
 class JiraContext:
     """Stage 2 output: Enriched Jira data."""
@@ -62,7 +98,7 @@ class JiraContext:
     subtasks: list[str] = field(default_factory=list)
 
     # Comments (from Jira)
-    comments: list[dict] = field(default_factory=list)  # [{author, created, body}]
+    comments: list[ContextComment] = field(default_factory=list)
 
     # Derived: Confluence space key (from labels or project)
     confluence_space_key: str = ""
@@ -136,17 +172,20 @@ class SelectionLog:
 
     def format_markdown(self) -> str:
         """Format selection log as markdown for output file."""
-        # Format candidates table
-        candidates_table = "| ID | Title | Excerpt |\n|---|---|---|\n"
+        # Format candidates table (rows joined once rather than grown with +=)
+        rows = []
         for c in self.candidates:
             excerpt = c.get("excerpt", "")[:100].replace("\n", " ").replace("|", "\\|")
-            candidates_table += f"| {c['id']} | {c['title']} | {excerpt}... |\n"
+            rows.append(f"| {c['id']} | {c['title']} | {excerpt}... |\n")
+        candidates_table = "| ID | Title | Excerpt |\n|---|---|---|\n" + "".join(rows)
 
         # Format selection result
-        selection_result = ""
+        selected = set(self.selected_ids)
+        lines = []
         for c in self.candidates:
-            status = "✅ SELECTED" if c["id"] in self.selected_ids else "❌ rejected"
-            selection_result += f"- [{status}] `{c['id']}` - {c['title']}\n"
+            status = "✅ SELECTED" if c["id"] in selected else "❌ rejected"
+            lines.append(f"- [{status}] `{c['id']}` - {c['title']}\n")
+        selection_result = "".join(lines)
 
         return f"""## System Prompt
 
@@ -180,7 +219,7 @@ class SelectionLog:
 
 
 @dataclass
-class RefinedConfluenceContext:
+class RefinedConfluenceContext(JsonBytesMixin):
     """Stage 3 output with Two-Stage Retrieval (API Search → LLM Reranking)."""
 
     # Meta
@@ -206,7 +245,7 @@ class RefinedConfluenceContext:
 
     def is_new_project(self) -> bool:
         """Check if this is a new project needing documentation."""
-        return self.project_status == ProjectStatus.NEW_PROJECT
+        return self.project_status is ProjectStatus.NEW_PROJECT
 
     def to_json(self) -> dict:
         """Convert to output JSON structure."""
@@ -235,13 +274,13 @@ class RefinedConfluenceContext:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """Stage 4 output: Unified context for LLM execution."""
 
     # Metadata
     issue_key: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.time)  # Unix time, see timestamp_iso
 
     # Stage 2 & 3 outputs
     jira: Optional[JiraContext] = None
@@ -254,187 +293,133 @@ class ExecutionContext:
 
     def build_prompt_context(self) -> str:
         """Build unified context string for LLM prompt."""
-        sections = []
+        # Written straight into one buffer. Every line after the first carries
+        # its own leading "\n", so the text matches a "\n".join of the lines.
+        buf = io.StringIO()
+        w = buf.write
 
         # Header
-        sections.append(f"# Task Context: {self.issue_key}")
-        sections.append(f"Generated: {self.timestamp.isoformat()}")
-        sections.append("")
+        w(f"# Task Context: {self.issue_key}\nGenerated: {self.timestamp_iso}\n")
 
         # Jira section
-        if self.jira:
-            sections.append("---")
-            sections.append("")
-            sections.append("## Jira Issue")
-            sections.append("")
-            sections.append(f"**Key:** {self.jira.issue_key}")
-            sections.append(f"**Title:** {self.jira.summary}")
-            sections.append(f"**Type:** {self.jira.issue_type}")
-            sections.append(f"**Status:** {self.jira.status}")
-            sections.append(f"**Project:** {self.jira.project_name} ({self.jira.project_key})")
-            sections.append(f"**Components:** {', '.join(self.jira.components) or 'None'}")
-            sections.append(f"**Labels:** {', '.join(self.jira.labels) or 'None'}")
-            sections.append(f"**Assignee:** {self.jira.assignee or 'Unassigned'}")
-
-            if self.jira.parent_key:
-                sections.append(f"**Parent:** {self.jira.parent_key}")
-            if self.jira.subtasks:
-                sections.append(f"**Subtasks:** {', '.join(self.jira.subtasks)}")
-
-            sections.append("")
-            sections.append("### Description")
-            sections.append("")
-            sections.append(self.jira.description or "[No description provided]")
-            sections.append("")
+        jira = self.jira
+        if jira:
+            w("\n---\n\n## Jira Issue\n")
+            w(
+                f"\n**Key:** {jira.issue_key}"
+                f"\n**Title:** {jira.summary}"
+                f"\n**Type:** {jira.issue_type}"
+                f"\n**Status:** {jira.status}"
+                f"\n**Project:** {jira.project_name} ({jira.project_key})"
+                f"\n**Components:** {', '.join(jira.components) or 'None'}"
+                f"\n**Labels:** {', '.join(jira.labels) or 'None'}"
+                f"\n**Assignee:** {jira.assignee or 'Unassigned'}"
+            )
+
+            if jira.parent_key:
+                w(f"\n**Parent:** {jira.parent_key}")
+            if jira.subtasks:
+                w(f"\n**Subtasks:** {', '.join(jira.subtasks)}")
+
+            w(f"\n\n### Description\n\n{jira.description or '[No description provided]'}\n")
 
             # Comments
-            if self.jira.comments:
-                sections.append("### Comments")
-                sections.append("")
-                for comment in self.jira.comments:
-                    author = comment.get("author", "Unknown")
-                    created = comment.get("created", "")
-                    body = comment.get("body", "")
-                    sections.append(f"**{author}** ({created}):")
-                    sections.append(f"> {body}")
-                    sections.append("")
+            if jira.comments:
+                w("\n### Comments\n")
+                for comment in jira.comments:
+                    w(f"\n**{comment.author}** ({comment.created}):\n> {comment.body}\n")
 
         # Refined Confluence section (Two-Stage Retrieval)
-        if self.refined_confluence:
-            sections.append("---")
-            sections.append("")
-            sections.append("## Project Knowledge Base")
-            sections.append("")
-            sections.append(f"**Space:** {self.refined_confluence.project_space}")
-            sections.append(f"**Status:** {self.refined_confluence.project_status.value}")
-            sections.append("")
-
-            # Brand-new project signal (greenfield)
-            if self.refined_confluence.project_status == ProjectStatus.BRAND_NEW:
-                sections.append("### BRAND NEW PROJECT")
-                sections.append("")
-                sections.append("**IMPORTANT:** This is a greenfield project with no existing Confluence documentation.")
-                sections.append("")
-                sections.append("Your work plan MUST include steps to create:")
-                sections.append("1. **Project Passport** page with sections:")
-                sections.append("   - Identity & Ownership")
-                sections.append("   - Technology Stack")
-                sections.append("   - Repositories")
-                sections.append("   - Environments")
-                sections.append("2. **Logical Architecture** page with sections:")
-                sections.append("   - Component Diagram")
-                sections.append("   - Data Flow")
-                sections.append("   - Contracts & Interfaces")
-                sections.append("   - Constraints")
-                sections.append("")
-                sections.append("Use `[DOCS]` layer for documentation creation steps.")
-                sections.append("")
+        refined = self.refined_confluence
+        if refined:
+            w(
+                "\n---\n\n## Project Knowledge Base\n"
+                f"\n**Space:** {refined.project_space}"
+                f"\n**Status:** {refined.project_status.value}\n"
+            )
+
+            # Status signal, e.g. brand-new (greenfield) project
+            banner = _STATUS_BANNERS.get(refined.project_status)
+            if banner:
+                w(banner)
 
             # Core documents (Mandatory Path)
-            if self.refined_confluence.core_documents:
-                sections.append("### Core Documentation (Mandatory)")
-                sections.append("")
-                for doc in self.refined_confluence.core_documents:
-                    sections.append(f"#### {doc.title}")
-                    sections.append(f"URL: {doc.url}")
-                    sections.append("")
-                    sections.append(doc.content)
-                    sections.append("")
+            if refined.core_documents:
+                w("\n### Core Documentation (Mandatory)\n")
+                for doc in refined.core_documents:
+                    w(f"\n#### {doc.title}\nURL: {doc.url}\n\n{doc.content}\n")
 
             # Supporting documents (Discovery Path)
-            if self.refined_confluence.supporting_documents:
-                sections.append("### Supporting Documentation (LLM Selected)")
-                sections.append("")
-                for doc in self.refined_confluence.supporting_documents:
-                    sections.append(f"#### {doc.title}")
-                    sections.append(f"URL: {doc.url}")
-                    sections.append("")
-                    sections.append(doc.content)
-                    sections.append("")
+            if refined.supporting_documents:
+                w("\n### Supporting Documentation (LLM Selected)\n")
+                for doc in refined.supporting_documents:
+                    w(f"\n#### {doc.title}\nURL: {doc.url}\n\n{doc.content}\n")
 
             # Missing critical data (informational)
-            if self.refined_confluence.missing_critical_data:
-                sections.append("### New Project Signal")
-                sections.append("")
-                sections.append("The following critical documents are missing (new project):")
-                for item in self.refined_confluence.missing_critical_data:
-                    sections.append(f"- {item}")
-                sections.append("")
+            if refined.missing_critical_data:
+                w(
+                    "\n### New Project Signal\n"
+                    "\nThe following critical documents are missing (new project):"
+                )
+                for item in refined.missing_critical_data:
+                    w(f"\n- {item}")
+                w("\n")
 
             # Retrieval errors
-            if self.refined_confluence.retrieval_errors:
-                sections.append("### Retrieval Warnings")
-                for err in self.refined_confluence.retrieval_errors:
-                    sections.append(f"- {err}")
-                sections.append("")
+            if refined.retrieval_errors:
+                w("\n### Retrieval Warnings")
+                for err in refined.retrieval_errors:
+                    w(f"\n- {err}")
+                w("\n")
 
         # Legacy Confluence section (backwards compatibility)
         elif self.confluence:
-            sections.append("---")
-            sections.append("")
-            sections.append("## Project Knowledge Base")
-            sections.append("")
-            sections.append(f"**Space:** {self.confluence.space_name} ({self.confluence.space_key})")
-            sections.append("")
-
-            if self.confluence.root_page_content:
-                sections.append(f"### {self.confluence.root_page_title or 'Space Homepage'}")
-                sections.append("")
-                sections.append(self.confluence.root_page_content)
-                sections.append("")
-
-            if self.confluence.sdlc_rules_content:
-                sections.append("---")
-                sections.append("")
-                sections.append("## SDLC & Workflow Rules")
-                sections.append("")
-                sections.append(self.confluence.sdlc_rules_content)
-                sections.append("")
-
-            if self.confluence.project_passport_content:
-                sections.append("---")
-                sections.append("")
-                sections.append("## Project Passport")
-                sections.append("")
-                sections.append(self.confluence.project_passport_content)
-                sections.append("")
-
-            if self.confluence.retrieval_errors:
-                sections.append("")
-                sections.append("### Retrieval Warnings")
-                for err in self.confluence.retrieval_errors:
-                    sections.append(f"- {err}")
-                sections.append("")
+            confluence = self.confluence
+            w(
+                "\n---\n\n## Project Knowledge Base\n"
+                f"\n**Space:** {confluence.space_name} ({confluence.space_key})\n"
+            )
+
+            if confluence.root_page_content:
+                title = confluence.root_page_title or "Space Homepage"
+                w(f"\n### {title}\n\n{confluence.root_page_content}\n")
+
+            if confluence.sdlc_rules_content:
+                w(f"\n---\n\n## SDLC & Workflow Rules\n\n{confluence.sdlc_rules_content}\n")
+
+            if confluence.project_passport_content:
+                w(f"\n---\n\n## Project Passport\n\n{confluence.project_passport_content}\n")
+
+            if confluence.retrieval_errors:
+                w("\n\n### Retrieval Warnings")
+                for err in confluence.retrieval_errors:
+                    w(f"\n- {err}")
+                w("\n")
 
         # GitHub section
         if self.github:
-            sections.append("---")
-            sections.append("")
-            sections.append("## Codebase Context (GitHub)")
-            sections.append("")
-            sections.append(self.github.format_markdown())
+            w(f"\n---\n\n## Codebase Context (GitHub)\n\n{self.github.format_markdown()}")
 
         # Global errors
         if self.errors:
-            sections.append("---")
-            sections.append("")
-            sections.append("## Context Errors")
+            w("\n---\n\n## Context Errors")
             for err in self.errors:
-                sections.append(f"- {err}")
-            sections.append("")
+                w(f"\n- {err}")
+            w("\n")
+
+        return buf.getvalue()
 
-        return "\n".join(sections)
+    @property
+    def timestamp_iso(self) -> str:
+        """Local-time ISO 8601 form of timestamp, formatted only when rendered."""
+        return datetime.fromtimestamp(self.timestamp).isoformat()
 
     def is_valid(self) -> bool:
         """Check if context has minimum required data."""
-        return (
-            self.jira is not None
-            and self.jira.summary
-            and self.jira.description
-        )
+        jira = self.jira
+        return jira is not None and bool(jira.summary) and bool(jira.description)
 
     def is_new_project(self) -> bool:
         """Check if this is a new project based on refined context."""
-        if self.refined_confluence:
-            return self.refined_confluence.is_new_project()
-        return False
+        refined = self.refined_confluence
+        return refined is not None and refined.project_status is ProjectStatus.NEW_PROJECT
@@ -5,10 +5,16 @@ Provides structured data from GitHub repositories to enhance LLM context
 with actual codebase information.
 """
 
+import io
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 
+from .json_output import JsonBytesMixin
+
+# format_markdown output for a repository that does not exist yet
+_NEW_PROJECT_MD = "**GitHub:** New project - repository to be created"
+
 
 class RepoStatus(Enum):
     """Repository discovery status."""
@@ -17,7 +23,7 @@ class RepoStatus(Enum):
     NEW_PROJECT = "new_project" # No URL found - repository to be created
 
 
-@dataclass
+@dataclass(slots=True)
 class RepoStructure:
     """Repository directory structure (filtered to key directories)."""
     tree: str                           # Markdown tree representation
@@ -26,7 +32,7 @@ class RepoStructure:
     primary_language: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigSummary:
     """Summary of a configuration file."""
     path: str                           # File path in repo (e.g., "package.json")
@@ -34,7 +40,7 @@ class ConfigSummary:
     in_confluence: bool = False         # True if details already in Confluence docs
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeSnippet:
     """Relevant code reference from the repository."""
     path: str                           # File path
@@ -43,8 +49,8 @@ class CodeSnippet:
     relevance: str                      # Why it's relevant to the task
 
 
-@dataclass
-class GitHubContext:
+@dataclass(slots=True)
+class GitHubContext(JsonBytesMixin):
     """
     Stage 3b output: GitHub repository context.
 
@@ -88,85 +94,83 @@ class GitHubContext:
 
     def format_markdown(self) -> str:
         """Format GitHub context as markdown for LLM prompt."""
-        if self.status == RepoStatus.NEW_PROJECT:
-            return "**GitHub:** New project - repository to be created"
+        status = self.status
+        if status is RepoStatus.NEW_PROJECT:
+            return _NEW_PROJECT_MD
 
-        if self.status == RepoStatus.NOT_FOUND:
+        if status is RepoStatus.NOT_FOUND:
             return f"**GitHub:** Repository not found or inaccessible ({self.repository_url})"
 
-        sections = []
-
         # Header
-        sections.append(f"**Repository:** [{self.owner}/{self.repo_name}]({self.repository_url})")
-        if self.primary_language:
-            sections.append(f"**Primary Language:** {self.primary_language}")
-        sections.append(f"**Default Branch:** {self.default_branch}")
-        sections.append("")
+        language = (
+            f"\n**Primary Language:** {self.primary_language}" if self.primary_language else ""
+        )
+        header = (
+            f"**Repository:** [{self.owner}/{self.repo_name}]({self.repository_url})"
+            f"{language}\n**Default Branch:** {self.default_branch}\n"
+        )
+        if not (
+            self.structure or self.configs or self.snippets or self.recent_commits
+            or self.open_prs or self.skipped_topics or self.retrieval_errors
+        ):
+            return header
+
+        # Sections follow the header in one buffer; each starts with the "\n"
+        # that separates it from the blank line ending the previous one
+        buf = io.StringIO()
+        w = buf.write
+        w(header)
 
         # Structure
         if self.structure:
-            sections.append("### Repository Structure")
-            sections.append("")
-            sections.append("```")
-            sections.append(self.structure.tree)
-            sections.append("```")
-            sections.append("")
+            w(f"\n### Repository Structure\n\n```\n{self.structure.tree}\n```\n")
 
         # Config summaries
         if self.configs:
-            sections.append("### Configuration Files")
-            sections.append("")
-            for config in self.configs:
-                if config.in_confluence:
-                    sections.append(f"- **{config.path}**: _(details in Confluence)_")
-                else:
-                    sections.append(f"- **{config.path}**: {config.summary}")
-            sections.append("")
+            w("\n### Configuration Files\n")
+            w("".join([
+                f"\n- **{config.path}**: _(details in Confluence)_"
+                if config.in_confluence
+                else f"\n- **{config.path}**: {config.summary}"
+                for config in self.configs
+            ]))
+            w("\n")
 
         # Code snippets
         if self.snippets:
-            sections.append("### Relevant Code References")
-            sections.append("")
-            for snippet in self.snippets:
-                sections.append(f"#### {snippet.path} (lines {snippet.lines})")
-                sections.append(f"_{snippet.relevance}_")
-                sections.append("")
-                sections.append("```")
-                sections.append(snippet.content)
-                sections.append("```")
-                sections.append("")
+            w("\n### Relevant Code References\n")
+            w("".join([
+                f"\n#### {snippet.path} (lines {snippet.lines})"
+                f"\n_{snippet.relevance}_\n\n```\n{snippet.content}\n```\n"
+                for snippet in self.snippets
+            ]))
 
         # Recent activity
         if self.recent_commits:
-            sections.append("### Recent Commits")
-            sections.append("")
-            for commit in self.recent_commits[:5]:
-                sections.append(f"- {commit}")
-            sections.append("")
+            w("\n### Recent Commits\n")
+            w("".join([f"\n- {commit}" for commit in self.recent_commits[:5]]))
+            w("\n")
 
         if self.open_prs:
-            sections.append("### Open Pull Requests")
-            sections.append("")
-            for pr in self.open_prs[:5]:
-                sections.append(f"- {pr}")
-            sections.append("")
+            w("\n### Open Pull Requests\n")
+            w("".join([f"\n- {pr}" for pr in self.open_prs[:5]]))
+            w("\n")
 
         # Deduplication note
         if self.skipped_topics:
-            sections.append("### Skipped (Already in Confluence)")
-            sections.append("")
-            sections.append(f"The following topics are documented in Confluence: {', '.join(self.skipped_topics)}")
-            sections.append("")
+            w(
+                "\n### Skipped (Already in Confluence)\n"
+                "\nThe following topics are documented in Confluence: "
+                f"{', '.join(self.skipped_topics)}\n"
+            )
 
         # Errors
         if self.retrieval_errors:
-            sections.append("### Retrieval Warnings")
-            sections.append("")
-            for err in self.retrieval_errors:
-                sections.append(f"- {err}")
-            sections.append("")
+            w("\n### Retrieval Warnings\n")
+            w("".join([f"\n- {err}" for err in self.retrieval_errors]))
+            w("\n")
 
-        return "\n".join(sections)
+        return buf.getvalue()
 
     def to_json(self) -> dict:
         """Convert to JSON structure for output files."""
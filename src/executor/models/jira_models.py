@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional, Any
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class JiraUser(BaseModel):
@@ -12,6 +12,8 @@ class JiraUser(BaseModel):
     email: Optional[str] = None
     display_name: str
 
+    model_config = ConfigDict(frozen=True)
+
 
 class JiraStatus(BaseModel):
     """Jira status."""
@@ -20,9 +22,7 @@ class JiraStatus(BaseModel):
     name: str
     status_category: str = Field(..., alias="statusCategory")
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class JiraIssueType(BaseModel):
@@ -32,6 +32,8 @@ class JiraIssueType(BaseModel):
     name: str  # Feature, Story, Task, Bug
     hierarchical_level: int = Field(0, description="0=Feature, -1=Story")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class JiraProject(BaseModel):
     """Jira project metadata."""
@@ -40,6 +42,8 @@ class JiraProject(BaseModel):
     name: str
     id: str
 
+    model_config = ConfigDict(frozen=True)
+
 
 class JiraComment(BaseModel):
     """Jira comment (cleaned)."""
@@ -50,31 +54,35 @@ class JiraComment(BaseModel):
     created: datetime
     updated: datetime
 
+    model_config = ConfigDict(frozen=True)
+
     @field_validator("body", mode="before")
     @classmethod
     def clean_body(cls, v: Any) -> str:
         """Clean comment body - extract text content."""
-        if isinstance(v, dict):
-            # Jira returns ADF (Atlassian Document Format) or plain text
-            if "content" in v:
-                # ADF format - extract text
-                return cls._extract_adf_text(v)
-            return str(v)
+        # Jira returns ADF (Atlassian Document Format) or plain text
+        if type(v) is str:
+            return v
+        if isinstance(v, dict) and "content" in v:
+            # ADF format - extract text
+            return cls._extract_adf_text(v)
         return str(v)
 
     @staticmethod
     def _extract_adf_text(adf: dict) -> str:
         """Extract plain text from Atlassian Document Format."""
-        text_parts = []
-
-        def traverse(node: dict) -> None:
+        # Depth-first walk with an explicit stack: no per-node closure call,
+        # and deeply nested documents cannot hit the recursion limit.
+        text_parts: list[str] = []
+        stack: list[dict] = [adf]
+        while stack:
+            node = stack.pop()
             if node.get("type") == "text":
                 text_parts.append(node.get("text", ""))
-            if "content" in node:
-                for child in node["content"]:
-                    traverse(child)
-
-        traverse(adf)
+            content = node.get("content")
+            if content:
+                # Reversed so children are visited in document order
+                stack.extend(reversed(content))
         return "".join(text_parts)
 
 
@@ -102,13 +110,13 @@ class JiraIssue(BaseModel):
     reporter: JiraUser
 
     # Metadata
-    labels: list[str] = Field(default_factory=list)
+    labels: tuple[str, ...] = Field(default_factory=tuple)
     created: datetime
     updated: datetime
 
     # Hierarchy
     parent_key: Optional[str] = Field(None, description="Parent Feature key if Story")
-    subtasks: list[str] = Field(default_factory=list, description="Child Story keys")
+    subtasks: tuple[str, ...] = Field(default_factory=tuple, description="Child Story keys")
 
     # Custom fields (project-specific)
     custom_fields: dict[str, Any] = Field(default_factory=dict)
@@ -119,9 +127,7 @@ class JiraIssue(BaseModel):
     # Direct Confluence link (from custom "Project Link" field — field ID configurable via env vars)
     project_link: str = Field("", description="Direct URL to Confluence project folder")
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     @field_validator("description", mode="before")
     @classmethod
@@ -0,0 +1,19 @@
+"""Shared JSON encoding for pipeline output models."""
+
+from typing import Any, Protocol
+
+import orjson
+
+
+class _HasToJson(Protocol):
+    def to_json(self) -> dict[str, Any]: ...
+
+
+class JsonBytesMixin:
+    """Adds to_json_bytes() to models that build their output dict in to_json()."""
+
+    __slots__ = ()  # Keeps slotted dataclasses free of a __dict__
+
+    def to_json_bytes(self: _HasToJson) -> bytes:
+        """Serialize the to_json() structure straight to UTF-8 JSON bytes."""
+        return orjson.dumps(self.to_json())
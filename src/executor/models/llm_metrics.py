@@ -1,11 +1,14 @@
 """LLM usage metrics tracking for the execution pipeline."""
 
+import io
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMCallMetrics:
     """Metrics for a single LLM API call."""
 
@@ -26,15 +29,25 @@ class LLMCallMetrics:
 
     # Timing
     duration_ms: int = 0
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Wall-clock nanoseconds; an int is cheaper to create than a datetime
+    # and is only converted on demand (see timestamp).
+    timestamp_ns: int = field(default_factory=time.time_ns)
 
     def __post_init__(self):
         """Ensure tokens_total is calculated if not provided."""
         if self.tokens_total == 0 and (self.tokens_in or self.tokens_out):
             self.tokens_total = self.tokens_in + self.tokens_out
+        # Every call of a run repeats a few model/purpose names; share them
+        self.model = sys.intern(self.model)
+        self.call_purpose = sys.intern(self.call_purpose)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Local time at which the call was recorded."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionMetrics:
     """Aggregated metrics for entire pipeline execution."""
 
@@ -45,39 +58,62 @@ class ExecutionMetrics:
     max_retries_hit: bool = False
     issue_key: str = ""
 
+    # Running totals, updated in add_call so the properties below are O(1)
+    _tokens_in: int = field(default=0, init=False, repr=False)
+    _tokens_out: int = field(default=0, init=False, repr=False)
+    _validation_attempts: int = field(default=0, init=False, repr=False)
+    _validation_failures: int = field(default=0, init=False, repr=False)
+    _retry_count: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self):
+        """Fold calls passed to the constructor into the running totals."""
+        for call in self.calls:
+            self._tally(call)
+
     def add_call(self, call: LLMCallMetrics) -> None:
         """Add a call to the metrics collection."""
         self.calls.append(call)
+        self._tally(call)
+
+    def _tally(self, call: LLMCallMetrics) -> None:
+        """Add one call's counts to the running totals."""
+        self._tokens_in += call.tokens_in
+        self._tokens_out += call.tokens_out
+        self._validation_attempts += call.validation_attempts
+        if call.validation_attempts > 0 and not call.validation_passed:
+            self._validation_failures += 1
+        if call.call_purpose == "retry":
+            self._retry_count += 1
 
     @property
     def total_tokens_in(self) -> int:
         """Total prompt tokens across all calls."""
-        return sum(c.tokens_in for c in self.calls)
+        return self._tokens_in
 
     @property
     def total_tokens_out(self) -> int:
         """Total completion tokens across all calls."""
-        return sum(c.tokens_out for c in self.calls)
+        return self._tokens_out
 
     @property
     def total_tokens(self) -> int:
         """Total tokens across all calls."""
-        return self.total_tokens_in + self.total_tokens_out
+        return self._tokens_in + self._tokens_out
 
     @property
     def total_validation_attempts(self) -> int:
         """Total validation attempts across all calls."""
-        return sum(c.validation_attempts for c in self.calls)
+        return self._validation_attempts
 
     @property
     def total_validation_failures(self) -> int:
         """Total validation failures across all calls."""
-        return sum(1 for c in self.calls if c.validation_attempts > 0 and not c.validation_passed)
+        return self._validation_failures
 
     @property
     def retry_count(self) -> int:
         """Number of retry calls made."""
-        return sum(1 for c in self.calls if c.call_purpose == "retry")
+        return self._retry_count
 
     @property
     def validation_failure_rate(self) -> float:
@@ -89,28 +125,25 @@ class ExecutionMetrics:
 
     def to_markdown(self) -> str:
         """Format metrics as markdown for output file."""
-        lines = [
-            f"# LLM Metrics: {self.issue_key}",
-            "",
-            f"Generated: {datetime.now().isoformat()}",
-            "",
-            "## Summary",
-            "",
-            "| Metric | Value |",
-            "|--------|-------|",
-            f"| Total Tokens In | {self.total_tokens_in:,} |",
-            f"| Total Tokens Out | {self.total_tokens_out:,} |",
-            f"| Total Tokens | {self.total_tokens:,} |",
-            f"| Validation Attempts | {self.total_validation_attempts} |",
-            f"| Validation Failures | {self.total_validation_failures} |",
-            f"| Retries Used | {self.retry_count} |",
-            f"| Max Retries Hit | {'Yes' if self.max_retries_hit else 'No'} |",
-            "",
-            "## Call Log",
-            "",
-            "| # | Purpose | Tokens In | Tokens Out | Validation | Duration |",
-            "|---|---------|-----------|------------|------------|----------|",
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        w(
+            f"# LLM Metrics: {self.issue_key}\n"
+            f"\nGenerated: {datetime.now().isoformat()}\n"
+            "\n## Summary\n"
+            "\n| Metric | Value |"
+            "\n|--------|-------|"
+            f"\n| Total Tokens In | {self.total_tokens_in:,} |"
+            f"\n| Total Tokens Out | {self.total_tokens_out:,} |"
+            f"\n| Total Tokens | {self.total_tokens:,} |"
+            f"\n| Validation Attempts | {self.total_validation_attempts} |"
+            f"\n| Validation Failures | {self.total_validation_failures} |"
+            f"\n| Retries Used | {self.retry_count} |"
+            f"\n| Max Retries Hit | {'Yes' if self.max_retries_hit else 'No'} |\n"
+            "\n## Call Log\n"
+            "\n| # | Purpose | Tokens In | Tokens Out | Validation | Duration |"
+            "\n|---|---------|-----------|------------|------------|----------|"
+        )
 
         for i, call in enumerate(self.calls, 1):
             validation_status = "N/A"
@@ -119,19 +152,18 @@ class ExecutionMetrics:
 
             duration_str = f"{call.duration_ms / 1000:.1f}s" if call.duration_ms > 0 else "N/A"
 
-            lines.append(
-                f"| {i} | {call.call_purpose} | {call.tokens_in:,} | "
+            w(
+                f"\n| {i} | {call.call_purpose} | {call.tokens_in:,} | "
                 f"{call.tokens_out:,} | {validation_status} | {duration_str} |"
             )
 
         # Add validation errors if any
         failed_calls = [c for c in self.calls if c.validation_errors]
         if failed_calls:
-            lines.extend(["", "## Validation Errors", ""])
+            w("\n\n## Validation Errors\n")
             for call in failed_calls:
-                lines.append(f"### Attempt {call.attempt_number}")
-                for error in call.validation_errors:
-                    lines.append(f"- {error}")
-                lines.append("")
+                w(f"\n### Attempt {call.attempt_number}")
+                w("".join([f"\n- {error}" for error in call.validation_errors]))
+                w("\n")
 
-        return "\n".join(lines)
+        return buf.getvalue()
@@ -1,25 +1,44 @@
 """Workflow state models based on SDLC template."""
 
-from enum import Enum
-from typing import Optional
+from typing import Final, Literal, Optional
 from pydantic import BaseModel, Field
 
 
-class WorkflowStatus(str, Enum):
+class WorkflowStatus:
     """
     Jira workflow statuses - exact names from SDLC template.
 
     These are case-sensitive and must match Jira board columns exactly.
+    Plain string constants: statuses are only ever compared with, and sent
+    to Jira as, strings.
     """
 
-    BACKLOG = "Backlog"
-    AI_TO_DO = "AI-TO-DO"
-    HUMAN_PLAN_REVIEW = "Human Plan Review"
-    READY_FOR_DEV = "Ready for Dev"
-    IN_PROGRESS = "In Progress"
-    REVIEW = "Review"
-    DEPLOYMENT = "Deployment"
-    DONE = "Done"
+    BACKLOG: Final[str] = "Backlog"
+    AI_TO_DO: Final[str] = "AI-TO-DO"
+    HUMAN_PLAN_REVIEW: Final[str] = "Human Plan Review"
+    READY_FOR_DEV: Final[str] = "Ready for Dev"
+    IN_PROGRESS: Final[str] = "In Progress"
+    REVIEW: Final[str] = "Review"
+    DEPLOYMENT: Final[str] = "Deployment"
+    DONE: Final[str] = "Done"
+
+    ALL: Final[frozenset[str]] = frozenset({
+        BACKLOG, AI_TO_DO, HUMAN_PLAN_REVIEW, READY_FOR_DEV,
+        IN_PROGRESS, REVIEW, DEPLOYMENT, DONE,
+    })
+
+
+# Validation type for status fields; must list the same names as WorkflowStatus
+WorkflowStatusName = Literal[
+    "Backlog",
+    "AI-TO-DO",
+    "Human Plan Review",
+    "Ready for Dev",
+    "In Progress",
+    "Review",
+    "Deployment",
+    "Done",
+]
 
 
 class ExecutorContext(BaseModel):
@@ -32,7 +51,7 @@ class ExecutorContext(BaseModel):
 
     # Feature identity
     jira_key: str = Field(..., description="Jira Feature key (e.g., AI-123)")
-    current_status: WorkflowStatus = Field(..., description="Current Jira status")
+    current_status: WorkflowStatusName = Field(..., description="Current Jira status")
 
     # Project metadata (from Project Passport)
     project_key: str = Field(..., description="Project key extracted from issue (e.g., 'AI')")
@@ -52,10 +71,6 @@ class ExecutorContext(BaseModel):
     feature_title: str = Field(..., description="Feature summary/title")
     feature_description: str = Field(..., description="Feature description")
 
-    class Config:
-        """Pydantic config."""
-        use_enum_values = True
-
 
 class PhaseContext(BaseModel):
     """Context specific to a phase execution."""
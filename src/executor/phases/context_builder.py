@@ -10,12 +10,12 @@ Stage 4: Data Aggregation - Build unified ExecutionContext
 import re
 import json
 import logging
-from datetime import datetime
 from typing import Optional
 
 from ..mcp.client import MCPClientManager
 from ..models.execution_context import (
     JiraContext,
+    ContextComment,
     ConfluenceContext,
     ExecutionContext,
     ProjectStatus,
@@ -254,9 +254,9 @@ def _parse_jira_response(issue_key: str, response: str) -> JiraContext:
     )
 
 
-def _parse_jira_comments(response: str) -> list[dict]:
+def _parse_jira_comments(response: str) -> list[ContextComment]:
     """
-    Parse Jira comments response into list of comment dicts.
+    Parse Jira comments response into a list of ContextComment.
 
     Response format from jira_server.py:
     Comments for KEY:
@@ -292,11 +292,7 @@ def _parse_jira_comments(response: str) -> list[dict]:
             # Rest is the body
             body = "\n".join(lines[1:]).strip()
 
-            comments.append({
-                "author": author,
-                "created": created,
-                "body": body,
-            })
+            comments.append(ContextComment(author=author, created=created, body=body))
 
     return comments
 
@@ -1515,7 +1511,6 @@ def build_execution_context(
 
     context = ExecutionContext(
         issue_key=issue_key,
-        timestamp=datetime.now(),
         jira=jira_context,
         confluence=confluence_context,
         refined_confluence=refined_confluence,
@@ -11,6 +11,7 @@ Based on SDLC rules: Phase 1, Stage 2 "Analysis & Decomposition"
 """
 
 import re
+import sys
 import logging
 from typing import Optional
 
@@ -33,6 +34,10 @@ logger = logging.getLogger(__name__)
 # Valid layers from SDLC taxonomy
 VALID_LAYERS = {"BE", "FE", "INFRA", "DB", "QA", "DOCS", "GEN"}
 
+# Layer name -> the canonical (interned) taxonomy string, so every story of a
+# layer shares one str instance and grouping by layer compares by identity
+_CANONICAL_LAYERS = {layer: sys.intern(layer) for layer in VALID_LAYERS}
+
 
 def extract_stories(work_plan: str) -> list[DecomposedStory]:
     """
@@ -68,9 +73,7 @@ def extract_stories(work_plan: str) -> list[DecomposedStory]:
 
         # Extract layer
         layer_match = re.search(r"\*\*Layer:\*\*\s*\[?(\w+)\]?", step_content, re.IGNORECASE)
-        layer = layer_match.group(1).upper() if layer_match else "GEN"
-        if layer not in VALID_LAYERS:
-            layer = "GEN"
+        layer = _CANONICAL_LAYERS.get(layer_match.group(1).upper(), "GEN") if layer_match else "GEN"
 
         # Extract files - handle both inline and bullet formats
         files_match = re.search(r"\*\*Files:\*\*\s*(.+?)(?=-\s*\*\*|\n\n|\Z)", step_content, re.DOTALL | re.IGNORECASE)
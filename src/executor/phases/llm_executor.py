@@ -402,7 +402,7 @@ class LLMExecutor:
 
         content = f"""# Context for {context.issue_key}
 
-Generated: {context.timestamp.isoformat()}
+Generated: {context.timestamp_iso}
 
 ---
 
@@ -4,18 +4,41 @@ Purpose: Prevent "garbage in, garbage out" by cleaning HTML/rich text to Markdow
 """
 
 import re
-from bs4 import BeautifulSoup
+import threading
 import html2text
+from lxml import etree
+
+# Markdown cleanup patterns (see _cleanup_markdown)
+_RE_BLANKS = re.compile(r"\n{3,}")
+_RE_TRAILWS = re.compile(r"[^\S\n]+(?=\n|$)")
+_RE_BULLET = re.compile(r"^(\s*)-\s+", re.MULTILINE)
+
+# Tag names as reported by lxml's HTML parser (prefixes are kept verbatim,
+# e.g. "ac:structured-macro"), for the Markdown emitter's dispatch
+_AC_MACRO = "ac:structured-macro"
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+_PANEL_MACROS = frozenset({"panel", "info", "note", "warning"})
+_DROP_TAGS = frozenset({"ac:parameter", "ac:image", "script", "style"})
+
+# Escapes for text that Markdown would otherwise read as markup, as html2text
+# does: a backslash before a Markdown character, and a list, heading or
+# blockquote marker at the start of a line ("1. ", "- ", "--", "+ ", "# ", ">")
+_RE_MD_BACKSLASH = re.compile(r"\\(?=[\\`*_{}\[\]()#+\-.!])")
+_RE_MD_LINE_MARKER = re.compile(r"\d+\.(?=\s)|[-+#](?=\s)|-(?=-)|#(?=#)|>")
+
+# Per-thread html2text converter (see _html_to_markdown)
+_h2t_local = threading.local()
 
 
 def clean_confluence_html(html_content: str) -> str:
     """
     Clean Confluence HTML storage format to clean Markdown.
 
-    Confluence uses custom HTML tags and macros. This function:
-    1. Parses HTML with BeautifulSoup
-    2. Removes Confluence-specific macros
-    3. Converts to Markdown using html2text
+    Confluence storage format is a small, well-defined HTML subset plus
+    ac:/ri: macros, so instead of a generic HTML-to-Markdown engine this:
+    1. Streams the HTML through lxml's parser (no tree is built)
+    2. Emits Markdown directly from start/end/data events
+    3. Converts code/panel macros, drops other macros
     4. Cleans up whitespace and formatting
 
     Args:
@@ -27,19 +50,13 @@ def clean_confluence_html(html_content: str) -> str:
     if not html_content or html_content.strip() == "":
         return ""
 
-    # Parse HTML
-    soup = BeautifulSoup(html_content, "html.parser")
+    # Fast path: no markup and no entities (common for stub pages)
+    if "<" not in html_content and "&" not in html_content:
+        return _escape_markdown(" ".join(html_content.split()), line_start=True)
 
-    # Remove Confluence-specific elements
-    _remove_confluence_macros(soup)
-    _clean_confluence_tables(soup)
-    _clean_confluence_links(soup)
-
-    # Convert to HTML string
-    cleaned_html = str(soup)
-
-    # Convert to Markdown
-    markdown = _html_to_markdown(cleaned_html)
+    parser = etree.HTMLParser(target=_MarkdownEmitter())
+    parser.feed(html_content)
+    markdown = parser.close()
 
     # Final cleanup
     markdown = _cleanup_markdown(markdown)
@@ -63,11 +80,13 @@ def clean_jira_html(html_content: str) -> str:
     if not html_content or html_content.strip() == "":
         return ""
 
-    # Parse HTML
-    soup = BeautifulSoup(html_content, "html.parser")
+    # Normalize with lxml (closes unbalanced tags) and serialize in C
+    root = etree.HTML(html_content)
+    if root is None:
+        return ""
 
     # Convert to Markdown
-    markdown = _html_to_markdown(str(soup))
+    markdown = _html_to_markdown(etree.tostring(root, method="html", encoding="unicode"))
 
     # Cleanup
     markdown = _cleanup_markdown(markdown)
@@ -75,73 +94,324 @@ def clean_jira_html(html_content: str) -> str:
     return markdown
 
 
-def _remove_confluence_macros(soup: BeautifulSoup) -> None:
-    """
-    Remove Confluence macros (structured-macro tags).
-
-    Macros like {panel}, {code}, {info} are converted to simpler equivalents.
-    """
-    # Remove all ac:structured-macro tags except code blocks
-    for macro in soup.find_all("ac:structured-macro"):
-        macro_name = macro.get("ac:name", "")
-
-        if macro_name == "code":
-            # Convert code macro to <pre><code>
-            code_body = macro.find("ac:plain-text-body")
-            if code_body:
-                code_tag = soup.new_tag("pre")
-                code_tag.string = code_body.get_text()
-                macro.replace_with(code_tag)
-        elif macro_name in ["panel", "info", "note", "warning"]:
-            # Convert panel to blockquote
-            rich_text = macro.find("ac:rich-text-body")
-            if rich_text:
-                blockquote = soup.new_tag("blockquote")
-                blockquote.string = rich_text.get_text()
-                macro.replace_with(blockquote)
-        else:
-            # Remove unknown macros
-            macro.decompose()
-
-    # Remove other Confluence-specific tags
-    for tag in soup.find_all(["ac:parameter", "ac:link", "ac:image"]):
-        tag.decompose()
+def _escape_markdown(text: str, line_start: bool) -> str:
+    """Backslash-escape text so it renders literally; see _RE_MD_LINE_MARKER."""
+    if "\\" in text:
+        text = _RE_MD_BACKSLASH.sub(r"\\\\", text)
+    if line_start:
+        match = _RE_MD_LINE_MARKER.match(text)
+        if match:
+            i = match.end() - 1
+            text = f"{text[:i]}\\{text[i:]}"
+    return text
 
 
-def _clean_confluence_tables(soup: BeautifulSoup) -> None:
-    """Clean Confluence table formatting."""
-    # Tables are generally OK in Markdown, but clean up attributes
-    for table in soup.find_all("table"):
-        # Remove all attributes except basic structure
-        table.attrs = {}
+class _MarkdownEmitter:
+    """
+    lxml parser target that writes Markdown for Confluence storage format.
 
+    Handles headings, paragraphs, lists, links, emphasis, code, tables,
+    blockquotes, code/panel macros and ac:link/ri:page references (rendered
+    as their link text or page title). Content of other macros and of
+    ac:parameter/ac:image is dropped; any other tag is transparent (only its
+    text is kept).
+    """
 
-def _clean_confluence_links(soup: BeautifulSoup) -> None:
-    """Convert Confluence links to standard <a> tags."""
-    for link in soup.find_all("ri:page"):
-        # Confluence internal page link
-        title = link.get("ri:content-title", "")
-        if title:
-            a_tag = soup.new_tag("a", href=f"#{title}")
-            a_tag.string = title
-            link.replace_with(a_tag)
+    def __init__(self) -> None:
+        self._out: list[str] = []
+        self._newlines = 0  # Newlines owed before the next text
+        self._nl_depth = 0  # Blockquote depth of the owed blank lines
+        self._space = False  # Whitespace seen since the last text
+        self._bol = True  # At beginning of line (after any prefix)
+        self._code_span = 0  # Depth inside inline code (no escaping)
+        self._skip = 0  # Depth inside dropped content
+        self._quote = 0  # Blockquote depth
+        self._lists: list[list] = []  # [ordered, counter] per open list
+        self._links: list[tuple[str, int]] = []
+        self._macros: list[str] = []
+        self._pre: list[str] | None = None
+        self._code: list[str] | None = None
+        self._cell: list[str] | None = None
+        self._row: list[str] = []
+        self._rows: list[str] = []
+        self._saved_out: list[str] = []
+        self._ac_link: list | None = None  # [output index, ri:page title]
+
+    # -- output helpers --
+
+    def _block(self, newlines: int) -> None:
+        """Request a line (1) or paragraph (2) break before the next text."""
+        if self._cell is not None:
+            self._space = True
+            return
+        if not self._out:
+            return
+        if self._newlines:
+            self._nl_depth = min(self._nl_depth, self._quote)
+        else:
+            self._nl_depth = self._quote
+        self._newlines = max(self._newlines, newlines)
+
+    def _write(self, text: str) -> None:
+        """Append text, flushing owed breaks or a collapsed space first."""
+        out = self._out
+        if self._newlines:
+            out.append(("\n" + "> " * self._nl_depth) * (self._newlines - 1))
+            out.append("\n" + "> " * self._quote)
+            self._newlines = 0
+            self._bol = True
+        elif not out and self._quote and self._cell is None:
+            out.append("> " * self._quote)
+        elif self._space and not self._bol:
+            out.append(" ")
+        self._space = False
+        if text:
+            out.append(text)
+            self._bol = False
+
+    def _open_mark(self, mark: str) -> None:
+        self._write(mark)
+        self._bol = True  # Swallow leading whitespace inside the span
+
+    def _close_mark(self, mark: str) -> None:
+        out = self._out
+        if out and out[-1] == mark:
+            out.pop()  # Empty span
+        else:
+            out.append(mark)
+        self._bol = False
+
+    def _emit_pre(self, text: str) -> None:
+        self._block(2)
+        self._write("\n".join("    " + line for line in text.split("\n")))
+        self._block(2)
+
+    # -- parser target interface --
+
+    def start(self, tag: str, attrib) -> None:
+        if self._skip:
+            self._skip += 1
+            return
+        if self._pre is not None:
+            return
+        if self._code is not None:
+            if tag == "ac:parameter":
+                self._skip = 1
+            return
+
+        if tag == "p" or tag == "div":
+            if not self._lists:
+                self._block(2)
+        elif tag == "br":
+            self._block(1)
+            self._write("")
+        elif tag == "strong" or tag == "b":
+            self._open_mark("**")
+        elif tag == "em" or tag == "i":
+            self._open_mark("_")
+        elif tag == "code":
+            self._open_mark("`")
+            self._code_span += 1
+        elif tag == "del" or tag == "s":
+            self._open_mark("~~")
+        elif tag == "a":
+            self._write("")
+            self._links.append((attrib.get("href", ""), len(self._out)))
+        elif tag == "li":
+            if self._cell is not None:
+                self._space = True
+            elif self._lists:
+                current = self._lists[-1]
+                current[1] += 1
+                bullet = f"{current[1]}. " if current[0] else "* "
+                self._block(1)
+                self._write("  " * len(self._lists) + bullet)
+                self._bol = True
+        elif tag == "ul" or tag == "ol":
+            if not self._lists:
+                self._block(2)
+            self._lists.append([tag == "ol", 0])
+        elif tag in _HEADING_TAGS:
+            self._block(2)
+            if self._cell is None:
+                self._write("#" * int(tag[1]) + " ")
+                self._bol = True
+        elif tag == "blockquote":
+            self._block(2)
+            self._quote += 1
+        elif tag == "pre":
+            self._pre = []
+        elif tag == "table":
+            self._block(2)
+            self._rows = []
+        elif tag == "tr":
+            self._row = []
+        elif tag == "td" or tag == "th":
+            self._saved_out = self._out
+            self._out = self._cell = []
+            self._bol = True
+        elif tag == "hr":
+            self._block(2)
+            self._write("* * *")
+            self._block(2)
+        elif tag == "img":
+            self._write(f"![{attrib.get('alt', '')}]({attrib.get('src', '')})")
+        elif tag == "ri:page":
+            title = attrib.get("ri:content-title", "")
+            if self._ac_link is not None:
+                self._ac_link[1] = title  # Used if the link has no body
+            elif title:
+                self._write(title)
+        elif tag == "ac:link":
+            self._ac_link = [len(self._out), ""]
+        elif tag == _AC_MACRO:
+            name = attrib.get("ac:name", "")
+            if name == "code":
+                self._macros.append(name)
+                self._code = []
+            elif name in _PANEL_MACROS:
+                self._macros.append(name)
+                self._block(2)
+                self._quote += 1
+            else:
+                self._skip = 1
+        elif tag in _DROP_TAGS:
+            self._skip = 1
+
+    def end(self, tag: str) -> None:
+        if self._skip:
+            self._skip -= 1
+            return
+        if self._pre is not None:
+            if tag == "pre":
+                text, self._pre = "".join(self._pre), None
+                self._emit_pre(text)
+            return
+        if self._code is not None and tag != _AC_MACRO:
+            return
+
+        if tag == "p" or tag == "div":
+            if not self._lists:
+                self._block(2)
+        elif tag == "strong" or tag == "b":
+            self._close_mark("**")
+        elif tag == "em" or tag == "i":
+            self._close_mark("_")
+        elif tag == "code":
+            self._close_mark("`")
+            if self._code_span:
+                self._code_span -= 1
+        elif tag == "del" or tag == "s":
+            self._close_mark("~~")
+        elif tag == "a":
+            if self._links:
+                href, index = self._links.pop()
+                text = "".join(self._out[index:])
+                del self._out[index:]
+                if href and not href.startswith("#"):
+                    text = f"<{href}>" if text == href else f"[{text}]({href})"
+                self._out.append(text)
+                self._bol = False
+        elif tag == "ul" or tag == "ol":
+            if self._lists:
+                self._lists.pop()
+            if not self._lists:
+                self._block(2)
+        elif tag in _HEADING_TAGS:
+            self._block(2)
+        elif tag == "blockquote":
+            if self._quote:
+                self._quote -= 1
+            self._block(2)
+        elif tag == "td" or tag == "th":
+            if self._cell is not None:
+                self._row.append("".join(self._cell).strip())
+                self._out, self._cell = self._saved_out, None
+                self._space = False
+        elif tag == "tr":
+            if self._row:
+                self._rows.append("| ".join(self._row))
+                if len(self._rows) == 1:
+                    self._rows.append("|".join(["---"] * len(self._row)))
+            self._row = []
+        elif tag == "table":
+            if self._rows:
+                self._block(2)
+                self._write("\n".join(self._rows))
+                self._block(2)
+            self._rows = []
+        elif tag == "ac:link":
+            if self._ac_link is not None:
+                index, title = self._ac_link
+                self._ac_link = None
+                if len(self._out) == index and title:
+                    self._write(title)
+        elif tag == _AC_MACRO:
+            name = self._macros.pop() if self._macros else ""
+            if name == "code":
+                text, self._code = "".join(self._code or ()), None
+                self._emit_pre(text)
+            elif name:
+                if self._quote:
+                    self._quote -= 1
+                self._block(2)
+
+    def data(self, text: str) -> None:
+        if self._skip:
+            return
+        if self._pre is not None:
+            self._pre.append(text)
+            return
+        if self._code is not None:
+            self._code.append(text)
+            return
+        words = text.split()
+        if not words:
+            if text:
+                self._space = True
+            return
+        if text[0].isspace():
+            self._space = True
+        line = " ".join(words)
+        if not self._code_span:
+            # Only a pending break or the line prefix precedes this text
+            line = _escape_markdown(line, line_start=self._bol or self._newlines > 0)
+        self._write(line)
+        self._space = text[-1].isspace()
+
+    def comment(self, text: str) -> None:
+        # lxml's HTML parser reports <![CDATA[...]]> as a comment
+        if self._skip or not text.startswith("[CDATA["):
+            return
+        if self._code is not None:
+            self._code.append(text[7:-2])
+        elif self._ac_link is not None:
+            self.data(text[7:-2])  # ac:plain-text-link-body
+
+    def close(self) -> str:
+        return "".join(self._out)
 
 
 def _html_to_markdown(html: str) -> str:
     """
     Convert HTML to Markdown using html2text.
 
-    Configured for clean, readable output.
+    Configured for clean, readable output. The converter is created once
+    per thread and reused across calls.
     """
-    h = html2text.HTML2Text()
+    h = getattr(_h2t_local, "converter", None)
+    if h is None:
+        h = html2text.HTML2Text()
+
+        # Configuration
+        h.ignore_links = False
+        h.ignore_images = False
+        h.ignore_emphasis = False
+        h.body_width = 0  # Don't wrap lines
+        h.unicode_snob = True
+        h.skip_internal_links = True
 
-    # Configuration
-    h.ignore_links = False
-    h.ignore_images = False
-    h.ignore_emphasis = False
-    h.body_width = 0  # Don't wrap lines
-    h.unicode_snob = True
-    h.skip_internal_links = True
+        _h2t_local.converter = h
 
     return h.handle(html)
 
@@ -155,13 +425,13 @@ def _cleanup_markdown(markdown: str) -> str:
     - Normalize list formatting
     """
     # Remove excessive newlines (more than 2)
-    markdown = re.sub(r"\n{3,}", "\n\n", markdown)
+    markdown = _RE_BLANKS.sub("\n\n", markdown)
 
     # Remove trailing whitespace from lines
-    markdown = "\n".join(line.rstrip() for line in markdown.split("\n"))
+    markdown = _RE_TRAILWS.sub("", markdown)
 
     # Normalize list indentation
-    markdown = re.sub(r"^(\s*)-\s+", r"\1- ", markdown, flags=re.MULTILINE)
+    markdown = _RE_BULLET.sub(r"\1- ", markdown)
 
     # Trim leading/trailing whitespace
     markdown = markdown.strip()
@@ -181,24 +451,31 @@ def extract_confluence_metadata(html_content: str) -> dict[str, str]:
     Returns:
         Dictionary of metadata
     """
-    soup = BeautifulSoup(html_content, "html.parser")
-    metadata = {}
+    metadata = {"headings": [], "tables": []}
+    if not html_content or html_content.strip() == "":
+        return metadata
 
-    # Extract headings
-    headings = []
-    for i in range(1, 7):
-        for heading in soup.find_all(f"h{i}"):
-            headings.append((i, heading.get_text().strip()))
-    metadata["headings"] = headings
+    # Single pass over the parsed tree, in document order
+    root = etree.fromstring(html_content, etree.HTMLParser())
+    if root is None:
+        # Comment-only or otherwise element-free input
+        return metadata
 
-    # Extract tables as structured data
+    headings = []
     tables = []
-    for table in soup.find_all("table"):
-        table_data = []
-        for row in table.find_all("tr"):
-            cells = [cell.get_text().strip() for cell in row.find_all(["td", "th"])]
-            table_data.append(cells)
-        tables.append(table_data)
+    for element in root.iter(*_HEADING_TAGS, "table"):
+        if element.tag == "table":
+            table_data = []
+            for row in element.iter("tr"):
+                cells = ["".join(cell.itertext()).strip() for cell in row.iter("td", "th")]
+                table_data.append(cells)
+            tables.append(table_data)
+        else:
+            headings.append((int(element.tag[1]), "".join(element.itertext()).strip()))
+
+    # Group headings by level (stable, so document order is kept within a level)
+    headings.sort(key=lambda heading: heading[0])
+    metadata["headings"] = headings
     metadata["tables"] = tables
 
     return metadata
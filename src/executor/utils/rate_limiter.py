@@ -6,6 +6,7 @@ Implements token bucket algorithm with exponential backoff.
 import time
 import asyncio
 import logging
+import threading
 from typing import TypeVar, Callable, Awaitable
 from functools import wraps
 
@@ -41,6 +42,7 @@ class RateLimiter:
         self._tokens = float(burst_size)
         self._last_update = time.monotonic()
         self._lock = asyncio.Lock() if asyncio.get_event_loop_policy() else None
+        self._sync_lock = threading.Lock()
 
     def _refill_tokens(self) -> None:
         """Refill tokens based on elapsed time."""
@@ -53,16 +55,17 @@ class RateLimiter:
         self._last_update = now
 
     def acquire_sync(self) -> None:
-        """Acquire a token synchronously, blocking if necessary."""
-        self._refill_tokens()
-
-        if self._tokens < 1.0:
-            wait_time = (1.0 - self._tokens) / self.requests_per_second
-            logger.debug(f"Rate limit: waiting {wait_time:.2f}s")
-            time.sleep(wait_time)
+        """Acquire a token synchronously, blocking if necessary (thread-safe)."""
+        with self._sync_lock:
             self._refill_tokens()
 
-        self._tokens -= 1.0
+            if self._tokens < 1.0:
+                wait_time = (1.0 - self._tokens) / self.requests_per_second
+                logger.debug(f"Rate limit: waiting {wait_time:.2f}s")
+                time.sleep(wait_time)
+                self._refill_tokens()
+
+            self._tokens -= 1.0
 
     async def acquire_async(self) -> None:
         """Acquire a token asynchronously."""
@@ -0,0 +1,69 @@
+"""Unit tests for the Confluence MCP server client."""
+
+import io
+import re
+import sys
+from pathlib import Path
+
+import orjson
+import pytest
+import requests
+
+# The servers import models as `executor.*`, as when spawned as scripts
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from executor.mcp.servers.confluence_server import _PAGE_BATCH, ConfluenceAPIClient
+
+
+def _search_response(page_ids: list[str]) -> requests.Response:
+    """A 200 search response listing the given page IDs."""
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(orjson.dumps({"results": [{"id": i, "title": i} for i in page_ids]}))
+    return response
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Client whose session answers each CQL `id in (...)` search with those IDs."""
+    client = ConfluenceAPIClient("https://example.atlassian.net/wiki", "user", "token")
+    client.searches = []
+
+    def request(method, url, params=None, **kwargs):
+        client.searches.append(params)
+        return _search_response(re.fullmatch(r"id in \((.*)\)", params["cql"]).group(1).split(","))
+
+    monkeypatch.setattr(client.session, "request", request)
+    return client
+
+
+class TestGetPagesByIds:
+    """Tests for ConfluenceAPIClient.get_pages_by_ids."""
+
+    def test_splits_ids_into_capped_batches(self, client):
+        """Every ID should be fetched, with no search over the batch limit."""
+        page_ids = [str(n) for n in range(1, 2 * _PAGE_BATCH + 2)]
+
+        pages = client.get_pages_by_ids(page_ids)
+
+        assert [page["id"] for page in pages] == page_ids
+        assert [params["limit"] for params in client.searches] == [_PAGE_BATCH, _PAGE_BATCH, 1]
+
+    def test_caches_pages_for_single_lookups(self, client):
+        """Pages from a batch should serve get_page_by_id without a request."""
+        client.get_pages_by_ids(["101", "102"])
+
+        assert client.get_page_by_id("102")["id"] == "102"
+        assert len(client.searches) == 1
+
+    def test_rejects_non_numeric_ids(self, client):
+        """An ID that could rewrite the CQL should raise before any request."""
+        with pytest.raises(ValueError, match="Invalid Confluence page ID"):
+            client.get_pages_by_ids(["101", "1) OR space = X OR id in (2"])
+
+        assert client.searches == []
+
+    def test_empty_input(self, client):
+        """No IDs should mean no request."""
+        assert client.get_pages_by_ids([]) == []
+        assert client.searches == []
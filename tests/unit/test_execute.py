@@ -0,0 +1,28 @@
+"""Unit tests for the execute.py dry-run context dump."""
+
+from datetime import datetime
+
+from execute import save_context_file
+from executor.models.execution_context import ExecutionContext
+
+
+class TestSaveContextFile:
+    """Tests for save_context_file output."""
+
+    def test_writes_context_with_iso_timestamp(self, tmp_path):
+        """The dump should render the float timestamp as ISO 8601."""
+        context = ExecutionContext(issue_key="AI-123", timestamp=1700000000.0)
+
+        context_file = save_context_file(context, str(tmp_path))
+
+        assert context_file == tmp_path / "AI-123" / "AI-123_context.md"
+        generated = datetime.fromtimestamp(1700000000.0).isoformat()
+        assert context_file.read_text(encoding="utf-8") == (
+            "# Context for AI-123\n"
+            "\n"
+            f"Generated: {generated}\n"
+            "\n"
+            "---\n"
+            "\n"
+            f"{context.build_prompt_context()}"
+        )
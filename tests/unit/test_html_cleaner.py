@@ -0,0 +1,178 @@
+"""Unit tests for Confluence storage format to Markdown cleaning."""
+
+from src.executor.utils.html_cleaner import clean_confluence_html, extract_confluence_metadata
+
+
+class TestCleanConfluenceHtml:
+    """Snapshot tests for clean_confluence_html output format."""
+
+    def test_empty_input_returns_empty_string(self):
+        """Empty or whitespace-only input should produce no Markdown."""
+        assert clean_confluence_html("") == ""
+        assert clean_confluence_html("   \n") == ""
+
+    def test_headings_paragraphs_and_inline_formatting(self):
+        """Headings, emphasis and links should use the established format."""
+        html = (
+            "<h1>Project Passport</h1>"
+            "<p>This is the <strong>passport</strong> for <em>Demo</em> project. "
+            'See <a href="https://github.com/acme/demo">repo</a>.</p>'
+            "<p>Inline <code>x = 1</code> and<br/>break</p>"
+        )
+
+        assert clean_confluence_html(html) == (
+            "# Project Passport\n"
+            "\n"
+            "This is the **passport** for _Demo_ project. "
+            "See [repo](https://github.com/acme/demo).\n"
+            "\n"
+            "Inline `x = 1` and\n"
+            "break"
+        )
+
+    def test_nested_and_ordered_lists(self):
+        """Lists should be indented per nesting level and numbered."""
+        html = (
+            "<h2>Technology Stack</h2>"
+            "<ul><li>PostgreSQL 15</li><li>Kafka<ul><li>topic-a</li></ul></li></ul>"
+            "<ol><li>First</li><li>Second</li></ol>"
+        )
+
+        assert clean_confluence_html(html) == (
+            "## Technology Stack\n"
+            "\n"
+            "  * PostgreSQL 15\n"
+            "  * Kafka\n"
+            "    * topic-a\n"
+            "\n"
+            "  1. First\n"
+            "  2. Second"
+        )
+
+    def test_table_rendering(self):
+        """Tables should render as pipe rows with a header separator."""
+        html = (
+            '<table class="wrapped"><colgroup><col/></colgroup><tbody>'
+            "<tr><th>Env</th><th>URL</th></tr>"
+            '<tr><td>Dev</td><td><a href="https://dev.example.com">dev</a></td></tr>'
+            "</tbody></table>"
+        )
+
+        assert clean_confluence_html(html) == (
+            "Env| URL\n"
+            "---|---\n"
+            "Dev| [dev](https://dev.example.com)"
+        )
+
+    def test_code_and_panel_macros(self):
+        """Code macros become indented blocks, panels become blockquotes."""
+        html = (
+            "<p>Intro text</p>"
+            '<ac:structured-macro ac:name="code">'
+            '<ac:parameter ac:name="language">python</ac:parameter>'
+            "<ac:plain-text-body><![CDATA[def foo():\n    return 1 < 2]]></ac:plain-text-body>"
+            "</ac:structured-macro>"
+            '<ac:structured-macro ac:name="warning">'
+            '<ac:parameter ac:name="title">T</ac:parameter>'
+            "<ac:rich-text-body><p>Danger</p><p>zone</p></ac:rich-text-body>"
+            "</ac:structured-macro>"
+        )
+
+        assert clean_confluence_html(html) == (
+            "Intro text\n"
+            "\n"
+            "    def foo():\n"
+            "        return 1 < 2\n"
+            "\n"
+            "> Danger\n"
+            ">\n"
+            "> zone"
+        )
+
+    def test_unknown_macros_dropped_and_page_refs_kept(self):
+        """Unknown macros are removed; ri:page references keep their title."""
+        html = (
+            '<ac:structured-macro ac:name="jira"><ac:parameter ac:name="key">AI-1</ac:parameter>'
+            "</ac:structured-macro>"
+            '<p>Standalone <ri:page ri:content-title="Other Page"/> ref</p>'
+            '<p>Link to <ac:link><ri:page ri:content-title="Logical Architecture"/></ac:link> page.</p>'
+            "<p>end &lt;tag&gt; * star _under_</p>"
+        )
+
+        assert clean_confluence_html(html) == (
+            "Standalone Other Page ref\n"
+            "\n"
+            "Link to Logical Architecture page.\n"
+            "\n"
+            "end <tag> * star _under_"
+        )
+
+    def test_link_body_preferred_over_page_title(self):
+        """An ac:link with a body renders the body, not the target title."""
+        html = (
+            '<p>See <ac:link><ri:page ri:content-title="X"/>'
+            "<ac:plain-text-link-body><![CDATA[the docs]]></ac:plain-text-link-body></ac:link>!</p>"
+        )
+
+        assert clean_confluence_html(html) == "See the docs!"
+
+    def test_line_start_markers_are_escaped(self):
+        """Text that would read as a list, heading or quote is escaped."""
+        html = (
+            "<p>1. not a list</p><p>- dash</p><p>+ plus</p><p># hash</p>"
+            "<p>&gt; gt</p><p>x<br/>2. y <code>3. code</code></p>"
+        )
+
+        assert clean_confluence_html(html) == (
+            "1\\. not a list\n"
+            "\n"
+            "\\- dash\n"
+            "\n"
+            "\\+ plus\n"
+            "\n"
+            "\\# hash\n"
+            "\n"
+            "\\> gt\n"
+            "\n"
+            "x\n"
+            "2\\. y `3. code`"
+        )
+
+    def test_lists_inside_blockquotes_and_panels(self):
+        """Lists in blockquotes and panels keep their bullets after the quote prefix."""
+        html = (
+            "<blockquote><ul><li>x</li></ul></blockquote>"
+            '<ac:structured-macro ac:name="info"><ac:rich-text-body>'
+            "<ul><li>a<ul><li>b</li></ul></li></ul>"
+            "</ac:rich-text-body></ac:structured-macro>"
+        )
+
+        assert clean_confluence_html(html) == (
+            ">   * x\n"
+            "\n"
+            ">   * a\n"
+            ">     * b"
+        )
+
+
+class TestExtractConfluenceMetadata:
+    """Tests for extract_confluence_metadata."""
+
+    def test_element_free_input_returns_empty_metadata(self):
+        """Input with no elements should yield empty metadata, not raise."""
+        empty = {"headings": [], "tables": []}
+        assert extract_confluence_metadata("") == empty
+        assert extract_confluence_metadata("   \n") == empty
+        assert extract_confluence_metadata("<!-- only a comment -->") == empty
+
+    def test_headings_and_tables(self):
+        """Headings are grouped by level; table rows keep their cell text."""
+        html = (
+            "<h2>B</h2><h1>A</h1>"
+            "<table><tr><th>Env</th><th>URL</th></tr><tr><td>Dev</td><td>x</td></tr></table>"
+        )
+
+        assert extract_confluence_metadata(html) == {
+            "headings": [(1, "A"), (2, "B")],
+            "tables": [[["Env", "URL"], ["Dev", "x"]]],
+        }
@@ -0,0 +1,184 @@
+"""Unit tests for the Jira MCP server client helpers."""
+
+import asyncio
+import io
+import sys
+from pathlib import Path
+
+import orjson
+import pytest
+import requests
+
+# The servers import models as `executor.*`, as when spawned as scripts
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from executor.mcp.servers import jira_server
+
+
+class _FakeClient:
+    """Jira client stand-in whose get_issue fails for selected keys."""
+
+    def __init__(self, failing: set[str]):
+        self.failing = failing
+
+    def get_issue(self, issue_key: str) -> dict:
+        if issue_key in self.failing:
+            raise ValueError(f"cannot fetch {issue_key}")
+        return {"key": issue_key}
+
+    def get_comments(self, issue_key: str) -> list[dict]:
+        return [{"id": f"{issue_key}-c1"}]
+
+
+class TestHydrateMany:
+    """Tests for hydrate_many."""
+
+    def test_failed_key_yields_its_exception_in_order(self, monkeypatch):
+        """A failing key should not cancel the rest of the batch."""
+        fake = _FakeClient(failing={"AI-2"})
+        monkeypatch.setattr(jira_server, "_client", lambda: fake)
+
+        results = asyncio.run(jira_server.hydrate_many(["AI-1", "AI-2", "AI-3"]))
+
+        assert results[0] == ({"key": "AI-1"}, None)
+        assert isinstance(results[1], ValueError)
+        assert str(results[1]) == "cannot fetch AI-2"
+        assert results[2] == ({"key": "AI-3"}, None)
+
+    def test_include_comments(self, monkeypatch):
+        """Comments should be fetched alongside each issue when requested."""
+        monkeypatch.setattr(jira_server, "_client", lambda: _FakeClient(failing=set()))
+
+        results = asyncio.run(jira_server.hydrate_many(["AI-1"], include_comments=True))
+
+        assert results == [({"key": "AI-1"}, [{"id": "AI-1-c1"}])]
+
+
+BASE_URL = "https://example.atlassian.net"
+ISSUE_URL = f"{BASE_URL}/rest/api/3/issue/AI-1"
+
+
+def _response(status: int, body: dict | None = None, etag: str | None = None) -> requests.Response:
+    """A canned Jira response."""
+    response = requests.Response()
+    response.status_code = status
+    response.raw = io.BytesIO(orjson.dumps(body) if body is not None else b"")
+    if etag:
+        response.headers["ETag"] = etag
+    return response
+
+
+class _FakeSession:
+    """Replays queued responses and records every request made."""
+
+    def __init__(self):
+        self.responses: list[requests.Response] = []
+        self.calls: list[tuple[str, str, dict]] = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """JiraAPIClient with a fake session and a JSON decoder that counts its calls."""
+    client = jira_server.JiraAPIClient(BASE_URL, "user", "token")
+    client.session = _FakeSession()
+    client.parses = 0
+    loads = jira_server._loads
+
+    def counting_loads(content):
+        client.parses += 1
+        return loads(content)
+
+    monkeypatch.setattr(jira_server, "_loads", counting_loads)
+    return client
+
+
+def _expire(client) -> None:
+    """Age every cached GET past its TTL so the next read revalidates it."""
+    for key, (_, etag, data) in client._get_cache.items():
+        client._get_cache[key] = (0.0, etag, data)
+
+
+class TestGetConditional:
+    """Tests for the ETag/TTL GET cache behind get_issue and get_comments."""
+
+    def test_response_with_etag_is_cached(self, client):
+        """A 200 with an ETag should serve repeat reads without a request."""
+        client.session.responses.append(_response(200, {"key": "AI-1"}, etag='"v1"'))
+
+        assert client.get_issue("AI-1") == {"key": "AI-1"}
+        assert client.get_issue("AI-1") == {"key": "AI-1"}
+        assert len(client.session.calls) == 1
+
+    def test_not_modified_renews_without_parsing(self, client):
+        """After the TTL a 304 should reuse the cached body and renew it."""
+        client.session.responses += [
+            _response(200, {"key": "AI-1"}, etag='"v1"'),
+            _response(304),
+        ]
+        client.get_issue("AI-1")
+        _expire(client)
+
+        assert client.get_issue("AI-1") == {"key": "AI-1"}
+        assert client.session.calls[1][2]["headers"] == {"If-None-Match": '"v1"'}
+        assert client.parses == 1
+        # Renewed: served from the cache again without a third request
+        assert client.get_issue("AI-1") == {"key": "AI-1"}
+        assert len(client.session.calls) == 2
+
+    def test_response_without_etag_is_not_cached(self, client):
+        """Without an ETag every read should go to Jira."""
+        client.session.responses += [
+            _response(200, {"key": "AI-1"}),
+            _response(200, {"key": "AI-1", "summary": "new"}),
+        ]
+
+        client.get_issue("AI-1")
+
+        assert client._get_cache == {}
+        assert client.get_issue("AI-1") == {"key": "AI-1", "summary": "new"}
+        assert len(client.session.calls) == 2
+
+    def test_write_invalidates_issue_and_sub_resources(self, client):
+        """A write should drop the issue and its comments, but not other issues."""
+        client.session.responses += [
+            _response(200, {"key": "AI-1"}, etag='"i1"'),
+            _response(200, {"comments": []}, etag='"c1"'),
+            _response(200, {"key": "AI-10"}, etag='"i10"'),
+            _response(201, {"id": "100"}),
+        ]
+        client.get_issue("AI-1")
+        client.get_comments("AI-1")
+        client.get_issue("AI-10")
+
+        client.add_comment("AI-1", "Done")
+
+        assert [key[0] for key in client._get_cache] == [f"{BASE_URL}/rest/api/3/issue/AI-10"]
+
+
+class TestTransitionCache:
+    """Tests for the cached transition IDs used by transition_issue."""
+
+    @pytest.mark.parametrize("status", [400, 404, 409])
+    def test_rejected_cached_id_falls_back_to_lookup(self, client, status):
+        """A stale cached ID should be dropped and the transition looked up again."""
+        issue = {"key": "AI-1", "fields": {"issuetype": {"id": "10001"}}}
+        client.session.responses += [
+            _response(200, issue, etag='"v1"'),
+            _response(status, {"errorMessages": ["Transition is not valid"]}),
+            _response(200, {**issue, "transitions": [{"id": "31", "to": {"name": "Done"}}]}),
+            _response(204),
+        ]
+        client.get_issue("AI-1")
+        client._transitions_cache[("AI", "10001")] = (float("inf"), {"done": "21"})
+
+        client.transition_issue("AI-1", "Done")
+
+        posts = [kwargs["data"] for method, _, kwargs in client.session.calls if method == "POST"]
+        assert [orjson.loads(body)["transition"]["id"] for body in posts] == ["21", "31"]
+        assert client._transitions_cache[("AI", "10001")][1] == {"done": "31"}
+        # The transition invalidated the issue's cached GET
+        assert client._get_cache == {}